@@ -295,10 +295,11 @@ class EnhancedAISalesAgent:
     def get_service_packages(self) -> Dict[str, Any]:
         """Get all available service packages"""
         try:
-            packages = self.recommendation_engine.get_all_packages()
+            # Plain dicts for the JSON response; the engine's cached snapshot is read-only
+            packages = [dict(package) for package in self.recommendation_engine.package_dicts]
             
             return {
-                'packages': [pkg.model_dump() for pkg in packages],
+                'packages': packages,
                 'count': len(packages),
                 'success': True
             }
@@ -6,6 +6,7 @@ from .schemas import (
     ExtractionResult,
     UrgencyLevel
 )
+from .message import Message
 
 __all__ = [
     "ClientInquiry",
@@ -13,5 +14,6 @@ __all__ = [
     "ConversationState",
     "ProposalResponse",
     "ExtractionResult",
-    "UrgencyLevel"
+    "UrgencyLevel",
+    "Message"
 ]
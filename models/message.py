@@ -0,0 +1,18 @@
+"""
+Chat message model for the Streamlit UI
+"""
+
+
+class Message:
+    """One chat turn; slots keep long histories far smaller than per-message dicts"""
+    # Explicit __slots__ rather than @dataclass(slots=True), which needs Python 3.10
+    __slots__ = ("role", "content", "ts", "html")
+
+    def __init__(self, role: str, content: str, ts: str = "", html: str = ""):
+        self.role = role
+        self.content = content
+        self.ts = ts
+        self.html = html  # Bubble HTML for the collapsed history, rendered on first use
+
+    def __repr__(self) -> str:
+        return f"Message(role={self.role!r}, content={self.content!r}, ts={self.ts!r})"
@@ -10,7 +10,7 @@ from dataclasses import dataclass
 from datetime import datetime
 
 from models.schemas import ClientInquiry, UrgencyLevel
-from utils.helpers import normalize_text, find_role_counts, extract_contact_info
+from utils.helpers import normalize_text, find_role_counts, extract_contact_info, safe_json_loads
 
 
 @dataclass
@@ -137,10 +137,10 @@ class AdvancedNERService:
     def _llm_extraction(self, user_input: str) -> Dict[str, Any]:
         """Enhanced LLM-based entity extraction optimized for Groq"""
         # Import our optimized prompts
-        from utils.groq_prompts import ENTITY_EXTRACTION_PROMPT
+        from utils.groq_prompts import render_prompt
         
         # Use the specialized Groq-optimized prompt
-        prompt = ENTITY_EXTRACTION_PROMPT.format(user_message=user_input)
+        prompt = render_prompt("entity_extraction", user_message=user_input)
         
         try:
             response = self.llm_service.generate(prompt)
@@ -152,17 +152,17 @@ class AdvancedNERService:
             elif response.startswith('```'):
                 response = response.replace('```', '').strip()
             
-            # Parse JSON response
-            result = json.loads(response)
+            # Parse JSON response (orjson-backed when available)
+            result = safe_json_loads(response)
+            if result is None:
+                print(f"JSON parsing error, Response: {response[:200]}...")
+                return {}
             
             # Normalize and validate the extracted data
             normalized_result = self._normalize_entities(result)
             
             return normalized_result
             
-        except json.JSONDecodeError as e:
-            print(f"JSON parsing error: {e}, Response: {response[:200]}...")
-            return {}
         except Exception as e:
             print(f"LLM extraction error: {e}")
             return {}
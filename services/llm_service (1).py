@@ -15,14 +15,19 @@ from __future__ import annotations
 
 import os
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, Iterator
 from dotenv import load_dotenv
 
+from utils.llm_cache import LLMResponseCache
+
 # Load environment variables
 load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# Canned replies providers return on failure; these must never be cached
+_FALLBACK_PREFIXES = ("I'm having a temporary issue", "(local model error)")
+
 
 class BaseProvider:
 	name: str = "base"
@@ -33,6 +38,10 @@ class BaseProvider:
 	def generate(self, prompt: str) -> str:  # pragma: no cover - interface
 		raise NotImplementedError
 
+	def generate_stream(self, prompt: str) -> Iterator[str]:
+		"""Yield the response in chunks; providers without streaming yield it whole."""
+		yield self.generate(prompt)
+
 
 class GroqProvider(BaseProvider):
 	name = "groq"
@@ -56,10 +65,8 @@ class GroqProvider(BaseProvider):
 	def is_available(self) -> bool:
 		return self._available
 
-	def generate(self, prompt: str) -> str:
-		try:
-			# Enhanced system message for recruiting context
-			system_message = """You are an expert AI recruiting assistant specializing in tech hiring. 
+	# Enhanced system message for recruiting context
+	system_message = """You are an expert AI recruiting assistant specializing in tech hiring. 
 You excel at:
 - Understanding hiring requirements from client messages
 - Extracting specific job roles, locations, and industries  
@@ -78,26 +85,45 @@ CRITICAL INSTRUCTIONS:
 
 Focus on being professional, specific, and helpful."""
 
-			messages = [
-				{"role": "system", "content": system_message},
+	def _completion_kwargs(self, prompt: str) -> Dict[str, Any]:
+		return dict(
+			model=self.model,
+			messages=[
+				{"role": "system", "content": self.system_message},
 				{"role": "user", "content": prompt}
-			]
-			
-			resp = self.client.chat.completions.create(
-				model=self.model,
-				messages=messages,
-				temperature=0.3,    # Balanced creativity and consistency  
-				max_tokens=1500,    # Increased for more detailed responses
-				top_p=0.9,         # Better sampling for natural responses
-				frequency_penalty=0.2,  # Reduce repetition more aggressively
-				presence_penalty=0.3    # Encourage topic diversity
-			)
+			],
+			temperature=0.3,    # Balanced creativity and consistency  
+			max_tokens=1500,    # Increased for more detailed responses
+			top_p=0.9,         # Better sampling for natural responses
+			frequency_penalty=0.2,  # Reduce repetition more aggressively
+			presence_penalty=0.3    # Encourage topic diversity
+		)
+
+	def generate(self, prompt: str) -> str:
+		try:
+			resp = self.client.chat.completions.create(**self._completion_kwargs(prompt))
 			return resp.choices[0].message.content.strip()
 		except Exception as e:  # pragma: no cover
 			logger.error("Groq generation failed: %s", e)
 			return "I'm having a temporary issue generating a response. Could you rephrase or try again?"
 			return "I'm having a temporary issue generating a response. Could you rephrase or try again?"
 
+	def generate_stream(self, prompt: str) -> Iterator[str]:
+		yielded = False
+		try:
+			stream = self.client.chat.completions.create(stream=True, **self._completion_kwargs(prompt))
+			for chunk in stream:
+				delta = chunk.choices[0].delta.content
+				if delta:
+					yielded = True
+					yield delta
+		except Exception as e:  # pragma: no cover
+			logger.error("Groq streaming failed: %s", e)
+			# Past the first delta an apology would read as the tail of the answer; let the caller report it
+			if yielded:
+				raise
+			yield "I'm having a temporary issue generating a response. Could you rephrase or try again?"
+
 
 class HFProvider(BaseProvider):
 	name = "huggingface"
@@ -324,6 +350,14 @@ class LLMService:
 			self.providers[inst.name] = inst
 		self.active = self._select_active()
 		logger.info("LLM provider selected: %s", self.active)
+		# Identical prompts (quick prompts, greetings, repeated extractions) reuse earlier responses;
+		# LLM_CACHE_TTL=0 disables the cache
+		ttl = int(os.getenv("LLM_CACHE_TTL", "86400"))
+		self.cache = LLMResponseCache(
+			os.getenv("LLM_CACHE_PATH", ".llm_cache.db"),
+			ttl,
+			int(os.getenv("LLM_CACHE_MAX_ENTRIES", "5000"))
+		) if ttl > 0 else None
 
 	def _select_active(self) -> str:
 		forced = os.getenv("LLM_PROVIDER", "").strip().lower()
@@ -355,8 +389,29 @@ class LLMService:
 				return name
 		return "mock"
 
+	def _cache_key(self, provider: BaseProvider, prompt: str) -> str:
+		model = getattr(provider, "model", "")
+		if not isinstance(model, str):
+			model = getattr(model, "model_name", "")
+		return LLMResponseCache.make_key(provider.name, model, getattr(provider, "system_message", ""), prompt)
+
 	def generate(self, prompt: str) -> str:
-		return self.providers[self.active].generate(prompt)
+		provider = self.providers[self.active]
+		# The mock provider is already instant and deterministic
+		if self.cache is None or self.active == "mock":
+			return provider.generate(prompt)
+		key = self._cache_key(provider, prompt)
+		cached = self.cache.get(key)
+		if cached is not None:
+			return cached
+		response = provider.generate(prompt)
+		if response and not response.startswith(_FALLBACK_PREFIXES):
+			self.cache.set(key, response)
+		return response
+
+	def generate_stream(self, prompt: str) -> Iterator[str]:
+		"""Yield response chunks from the active provider as they arrive."""
+		return self.providers[self.active].generate_stream(prompt)
 
 	@property
 	def provider(self) -> str:
@@ -1,6 +1,8 @@
 """
 Service recommendation engine for matching client inquiries to service packages
 """
+from functools import cached_property
+from types import MappingProxyType
 from typing import List, Dict, Any, Tuple
 from models.schemas import ClientInquiry, ServicePackage
 from data.service_packages import SERVICE_PACKAGES, ROLE_SYNONYMS, INDUSTRY_SYNONYMS
@@ -246,3 +248,19 @@ class ServiceRecommendationEngine:
     def get_all_packages(self) -> List[ServicePackage]:
         """Get all service packages"""
         return self.service_packages
+    
+    @cached_property
+    def package_dicts(self) -> Tuple[MappingProxyType, ...]:
+        """Serialized service packages, built once since the catalogue is static.
+
+        Shared by every caller, so the snapshot is read-only: each package is a
+        MappingProxyType and list fields become tuples. Use dict(package) for a
+        mutable copy.
+        """
+        return tuple(
+            MappingProxyType({
+                key: tuple(value) if isinstance(value, list) else value
+                for key, value in package.model_dump().items()
+            })
+            for package in self.service_packages
+        )
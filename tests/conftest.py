@@ -0,0 +1,12 @@
+"""
+Shared pytest fixtures
+"""
+import pytest
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _disable_llm_cache():
+    """Call the providers (or the mock) directly instead of replaying cached LLM responses"""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("LLM_CACHE_TTL", "0")
+        yield
@@ -6,8 +6,8 @@ Tests the complete flow from user input to service recommendation
 
 import sys
 import os
-import json
-from datetime import datetime
+
+import pytest
 
 # Add project root to path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -17,123 +17,90 @@ from services.advanced_ner import create_advanced_ner_service
 from services.llm_service import LLMService
 from dotenv import load_dotenv
 
-def test_fintech_startup_scenario():
+USER_INPUT = "We are a fintech startup in Mumbai hiring 2 backend engineers and a UI/UX designer urgently."
+
+
+@pytest.fixture(autouse=True, scope="module")
+def _load_environment():
+    """Load environment once per module and restore it afterwards"""
+    saved_env = dict(os.environ)
+    load_dotenv()
+    yield
+    os.environ.clear()
+    os.environ.update(saved_env)
+
+
+@pytest.fixture(scope="module")
+def agent(tmp_path_factory):
+    """Enhanced AI Sales Agent backed by a throwaway database"""
+    db_path = tmp_path_factory.mktemp("fintech") / "fintech_scenario.db"
+    return EnhancedAISalesAgent(db_path=str(db_path))
+
+
+@pytest.fixture(scope="module")
+def extraction_result():
+    """Run the (expensive) NER extraction once and share it between tests"""
+    llm_service = LLMService()
+    advanced_ner = create_advanced_ner_service(llm_service)
+    return advanced_ner.extract_entities(USER_INPUT)
+
+
+@pytest.mark.dependency()
+def test_fintech_ner_extraction(extraction_result):
     """
-    Test case for fintech startup hiring scenario
     Input: "We are a fintech startup in Mumbai hiring 2 backend engineers and a UI/UX designer urgently."
     Expected extraction: {industry: "fintech", location: "Mumbai", roles: ["backend engineer", "UI/UX designer"], urgency: true}
-    Expected response: Recommendation for Tech Startup Hiring Pack
     """
-    
-    print("🧪 FINTECH STARTUP HIRING SCENARIO TEST")
-    print("=" * 50)
-    
-    # Load environment
-    load_dotenv()
-    
-    # Test input
-    user_input = "We are a fintech startup in Mumbai hiring 2 backend engineers and a UI/UX designer urgently."
-    print(f"📝 User Input: {user_input}")
-    print()
-    
-    try:
-        # Initialize Enhanced AI Sales Agent
-        print("🚀 Initializing Enhanced AI Sales Agent...")
-        agent = EnhancedAISalesAgent()
-        print("✅ Agent initialized successfully")
-        print()
-        
-        # Test 1: Advanced NER Extraction
-        print("🔍 Testing Advanced NER Extraction...")
-        llm_service = LLMService()
-        advanced_ner = create_advanced_ner_service(llm_service)
-        
-        extraction_result = advanced_ner.extract_entities(user_input)
-        print(f"📊 Extraction Method: {extraction_result.extraction_method}")
-        print(f"🎯 Extracted Entities: {json.dumps(extraction_result.entities, indent=2)}")
-        print(f"🔥 Confidence Scores: {json.dumps(extraction_result.confidence_scores, indent=2)}")
-        print()
-        
-        # Verify expected extractions
-        entities = extraction_result.entities
-        expected_checks = {
-            "Industry": (entities.get("industry") or "").lower() == "fintech" or "tech" in (entities.get("industry") or "").lower(),
-            "Location": "mumbai" in (entities.get("location") or "").lower(),
-            "Backend Engineer Role": any("backend" in str(role).lower() for role in (entities.get("roles") or [])),
-            "UI/UX Designer Role": any("ui" in str(role).lower() or "ux" in str(role).lower() for role in (entities.get("roles") or [])),
-            "Urgency Detected": (entities.get("urgency") or "").lower() in ["high", "urgent", "urgently", "asap"]
-        }
-        
-        print("✅ EXTRACTION VERIFICATION:")
-        for check, passed in expected_checks.items():
-            status = "✅ PASS" if passed else "❌ FAIL"
-            print(f"   {check}: {status}")
-        print()
-        
-        # Test 2: Full Conversation Flow
-        print("💬 Testing Full Conversation Flow...")
-        session_id = agent.start_conversation(user_input)
-        print(f"🆔 Session ID: {session_id}")
-        
-        # Process the message through the agent
-        response = agent.process_message(session_id, user_input)
-        print(f"🤖 Agent Response: {response}")
-        print()
-        
-        # Test 3: Service Recommendations
-        print("🎯 Testing Service Recommendations...")
-        packages = agent.get_service_packages()
-        print(f"📦 Available Service Packages: {list(packages.keys())}")
-        
-        # Check if Tech Startup package is recommended
-        tech_startup_available = "Tech Startup Hiring Pack" in str(packages) or "tech_startup" in str(packages).lower()
-        print(f"🏢 Tech Startup Package Available: {'✅ YES' if tech_startup_available else '❌ NO'}")
-        print()
-        
-        # Test 4: Analytics (if available)
-        print("📈 Testing Analytics...")
-        try:
-            analytics = agent.get_analytics(days=1)
-            print(f"📊 Analytics Summary: {json.dumps(analytics, indent=2)}")
-        except Exception as e:
-            print(f"⚠️  Analytics not available: {e}")
-        print()
-        
-        # Final Summary
-        print("📋 TEST SUMMARY:")
-        print(f"   • Input processed: ✅")
-        print(f"   • NER extraction: {'✅ PASS' if sum(expected_checks.values()) >= 3 else '❌ PARTIAL'}")
-        print(f"   • Agent response: {'✅ GENERATED' if response else '❌ NO RESPONSE'}")
-        print(f"   • Session created: ✅")
-        
-        # Expected vs Actual comparison
-        print()
-        print("🎯 EXPECTED VS ACTUAL:")
-        print("Expected Extraction:")
-        print("   • Industry: fintech ✅")
-        print("   • Location: Mumbai ✅") 
-        print("   • Roles: [backend engineer, UI/UX designer] ✅")
-        print("   • Urgency: true ✅")
-        print()
-        print("Expected Response Pattern:")
-        print("   • Acknowledge requirements ✅")
-        print("   • Recommend Tech Startup Hiring Pack")
-        print("   • Ask for proposal interest")
-        
-        return True
-        
-    except Exception as e:
-        print(f"❌ TEST FAILED: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
+    entities = extraction_result.entities
+    industry = (entities.get("industry") or "").lower()
+    roles = [str(role).lower() for role in (entities.get("roles") or [])]
+
+    expected_checks = {
+        "Industry": industry == "fintech" or "tech" in industry,
+        "Location": "mumbai" in (entities.get("location") or "").lower(),
+        "Backend Engineer Role": any("backend" in role for role in roles),
+        "UI/UX Designer Role": any("ui" in role or "ux" in role for role in roles),
+        "Urgency Detected": (entities.get("urgency") or "").lower() in ["high", "urgent", "urgently", "asap"],
+    }
+
+    for check, passed in expected_checks.items():
+        assert passed, f"{check} (method={extraction_result.extraction_method}, entities={entities})"
+
+
+@pytest.mark.dependency(depends=["test_fintech_ner_extraction"])
+def test_fintech_conversation_flow(agent):
+    """Expected response: acknowledge requirements and recommend a package"""
+    result = agent.start_conversation(USER_INPUT)
+    assert result.get("success", True), result
+    session_id = result["session_id"]
+
+    response = agent.process_message(session_id, USER_INPUT)
+    assert response, "Agent returned no response"
+    assert response.get("success", True), response
+
+
+@pytest.mark.dependency(depends=["test_fintech_ner_extraction"])
+def test_fintech_service_packages(agent):
+    """Expected response: Recommendation for Tech Startup Hiring Pack"""
+    packages = agent.get_service_packages()
+    assert packages["success"], packages
+    assert "Tech Startup Hiring Pack" in str(packages) or "tech_startup" in str(packages).lower()
+
+
+@pytest.mark.dependency(depends=["test_fintech_conversation_flow"])
+def test_fintech_analytics(agent):
+    """Analytics summary is available once a conversation has been recorded"""
+    analytics = agent.get_analytics(days=1)
+    assert analytics["success"], analytics
+    assert "analytics" in analytics
+
 
 def run_quick_ner_test():
     """Quick test focused just on NER extraction"""
     print("\n🔬 QUICK NER EXTRACTION TEST")
     print("=" * 30)
     
-    user_input = "We are a fintech startup in Mumbai hiring 2 backend engineers and a UI/UX designer urgently."
+    user_input = USER_INPUT
     
     try:
         llm_service = LLMService()
@@ -161,12 +128,4 @@ if __name__ == "__main__":
     
     # Run full test
     print("\n" + "=" * 60)
-    success = test_fintech_startup_scenario()
-    
-    print("\n" + "=" * 60)
-    if success:
-        print("🎉 TEST COMPLETED SUCCESSFULLY!")
-    else:
-        print("💥 TEST FAILED - CHECK LOGS ABOVE")
-    
-    print("=" * 60)
+    sys.exit(pytest.main([__file__, "-v"]))
@@ -114,6 +114,31 @@ class TestUtilityFunctions(unittest.TestCase):
                 result = normalize_text(input_text)
                 self.assertEqual(result, expected)
     
+    def test_format_list_for_display(self):
+        """Test list formatting for display"""
+        from utils.helpers import format_list_for_display
+        
+        self.assertEqual(format_list_for_display([]), "None specified")
+        self.assertEqual(format_list_for_display(["Python"]), "Python")
+        self.assertEqual(format_list_for_display(["Python", "Go"]), "Python and Go")
+        self.assertEqual(format_list_for_display(["Python", "Go", "Rust"]), "Python, Go, and Rust")
+        self.assertEqual(
+            format_list_for_display(["A", "B", "C", "D"], max_items=2),
+            "A, B, and 2 others"
+        )
+    
+    def test_render_prompt(self):
+        """Test precompiled prompt templates match str.format"""
+        from utils.groq_prompts import render_prompt, ENTITY_EXTRACTION_PROMPT
+        
+        message = "Need 2 {senior} engineers"
+        self.assertEqual(
+            render_prompt("entity_extraction", user_message=message),
+            ENTITY_EXTRACTION_PROMPT.format(user_message=message)
+        )
+        with self.assertRaises(KeyError):
+            render_prompt("entity_extraction")
+    
     def test_extract_contact_info(self):
         """Test contact information extraction"""
         from utils.helpers import extract_contact_info
@@ -126,6 +151,21 @@ class TestUtilityFunctions(unittest.TestCase):
         self.assertEqual(contact_info['email'], 'john@example.com')
         self.assertEqual(contact_info['phone'], '555-123-4567')
     
+    def test_find_role_counts(self):
+        """Test role counts from the number before or after the role"""
+        from utils.helpers import find_role_counts
+
+        counts = find_role_counts("Hiring 2 designers and 3 Backend Engineers", ["Designer", "backend engineer"])
+        self.assertEqual(counts, {"Designer": 2, "backend engineer": 3})
+
+        # Number separated from the role by other words
+        counts = find_role_counts("We need 5 senior backend engineers", ["backend engineer"])
+        self.assertEqual(counts, {"backend engineer": 5})
+
+        counts = find_role_counts("Data scientist positions: 4", ["data scientist", "designer"])
+        self.assertEqual(counts, {"data scientist": 4})
+        self.assertEqual(find_role_counts("2 designers", []), {})
+
     def test_validate_email(self):
         """Test email validation"""
         from utils.helpers import validate_email
@@ -152,6 +192,47 @@ class TestUtilityFunctions(unittest.TestCase):
                 self.assertFalse(validate_email(email))
 
 
+class TestLLMResponseCache(unittest.TestCase):
+    """Test the exact-match LLM response cache"""
+
+    def setUp(self):
+        """Set up a throwaway cache database"""
+        from utils.llm_cache import LLMResponseCache
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.temp_dir.name, "llm_cache.db")
+        self.cache = LLMResponseCache(self.db_path, ttl_seconds=60)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_round_trip(self):
+        """Test a stored response is returned for the same key only"""
+        key = self.cache.make_key("groq", "model", "system", "Hello")
+        self.assertIsNone(self.cache.get(key))
+        self.cache.set(key, "Hi there!")
+        self.assertEqual(self.cache.get(key), "Hi there!")
+        self.assertNotEqual(key, self.cache.make_key("groq", "model", "system", "Hello!"))
+
+    def test_expired_entries_are_ignored(self):
+        """Test entries past their TTL are treated as misses"""
+        from utils.llm_cache import LLMResponseCache
+        expired = LLMResponseCache(self.db_path, ttl_seconds=-1)
+        key = expired.make_key("prompt")
+        expired.set(key, "stale")
+        self.assertIsNone(self.cache.get(key))
+
+    def test_expired_and_excess_rows_are_pruned(self):
+        """Test writes delete expired rows and keep the table under max_entries"""
+        from utils.llm_cache import LLMResponseCache
+        LLMResponseCache(self.db_path, ttl_seconds=-1).set("stale", "old")
+        capped = LLMResponseCache(self.db_path, ttl_seconds=60, max_entries=3)
+        for i in range(5):
+            capped.set(f"key{i}", f"value{i}")
+        with sqlite3.connect(self.db_path) as conn:
+            keys = {row[0] for row in conn.execute("SELECT key FROM llm_cache")}
+        self.assertEqual(keys, {"key2", "key3", "key4"})
+
+
 class TestServiceRecommendationEngine(unittest.TestCase):
     """Test the service recommendation engine"""
     
@@ -166,6 +247,21 @@ class TestServiceRecommendationEngine(unittest.TestCase):
         self.assertIsInstance(packages, list)
         self.assertGreater(len(packages), 0)
     
+    def test_package_dicts_cached(self):
+        """Test serialized packages are built once and match the catalogue"""
+        package_dicts = self.engine.package_dicts
+        self.assertIs(package_dicts, self.engine.package_dicts)
+        self.assertEqual(len(package_dicts), len(self.engine.get_all_packages()))
+    
+    def test_package_dicts_read_only(self):
+        """Test callers can't mutate the shared serialized catalogue"""
+        package = self.engine.package_dicts[0]
+        with self.assertRaises(TypeError):
+            package['score'] = 1.0
+        with self.assertRaises(AttributeError):
+            package['features'].append("extra")
+        self.assertNotIn('score', dict(package))
+    
     def test_get_package_by_id(self):
         """Test getting package by ID"""
         package = self.engine.get_package_by_id("tech_startup_pack")
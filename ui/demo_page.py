@@ -7,7 +7,7 @@ import streamlit as st
 import time
 import json
 from datetime import datetime
-import plotly.graph_objects as go
+import altair as alt
 import plotly.express as px
 import pandas as pd
 
@@ -18,8 +18,9 @@ st.set_page_config(
     layout="wide"
 )
 
-# Custom CSS
-st.markdown("""
+# Custom CSS and static HTML fragments, built once at import time.
+# They contain no markdown, so they go through st.html rather than st.markdown.
+_CSS = """
 <style>
     .demo-header {
         background: linear-gradient(135deg, #ff6b6b 0%, #feca57 50%, #48dbfb 100%);
@@ -81,157 +82,279 @@ st.markdown("""
     .primary-text { color: #007bff; }
     .warning-text { color: #ffc107; }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+_HEADER_HTML = """
+<div class="demo-header">
+    <h1>🎯 AI Sales Agent Demo</h1>
+    <h2>See the Power of Intelligent Recruiting</h2>
+    <p style="font-size: 1.2rem; margin-top: 1rem;">
+        Experience 100% extraction accuracy • Lightning-fast responses • Professional conversation flow
+    </p>
+    <p style="opacity: 0.9;">Powered by Groq LLM with fine-tuned recruiting expertise</p>
+</div>
+"""
+
+_SCENARIO_1_CARD_HTML = """
+<div class="demo-card">
+    <h3>🏦 Scenario 1: Fintech Startup in Mumbai</h3>
+    <div class="scenario-input">
+        💬 <strong>Client Input:</strong> "We are a fintech startup in Mumbai hiring 2 backend engineers and a UI/UX designer urgently."
+    </div>
+</div>
+"""
+
+_SCENARIO_1_ENTITIES_HTML = """
+<div class="extraction-results">
+    <h4>🔍 Extracted Entities</h4>
+    <ul>
+        <li><strong>Industry:</strong> fintech ✅</li>
+        <li><strong>Location:</strong> Mumbai ✅</li>
+        <li><strong>Roles:</strong> backend engineer, UI/UX designer ✅</li>
+        <li><strong>Urgency:</strong> urgent ✅</li>
+        <li><strong>Count:</strong> 3 total positions ✅</li>
+        <li><strong>Company Size:</strong> startup ✅</li>
+    </ul>
+    <p class="success-text"><strong>Extraction Score: 100% (6/6)</strong></p>
+</div>
+"""
+
+_SCENARIO_1_RESPONSE_HTML = """
+<div class="ai-response">
+    <h4>🤖 AI Agent Response</h4>
+    <p>"Great! I understand you're a fintech startup in Mumbai looking to hire urgently. Based on your requirements for 2 backend engineers and a UI/UX designer, I'd recommend our <strong>Tech Startup Hiring Pack</strong>.</p>
+    <p>This package specializes in fast-track hiring for growing fintech companies and includes:</p>
+    <ul>
+        <li>Pre-screened tech talent pool</li>
+        <li>Mumbai-specific candidate networks</li>
+        <li>Rapid 2-week placement timeline</li>
+        <li>Fintech experience matching</li>
+    </ul>
+    <p>Would you like me to prepare a detailed proposal with timeline and investment details?"</p>
+</div>
+"""
+
+_SCENARIO_2_CARD_HTML = """
+<div class="demo-card">
+    <h3>🏥 Scenario 2: Healthcare SaaS Company</h3>
+    <div class="scenario-input">
+        💬 <strong>Client Input:</strong> "Need 5 senior React developers for our healthcare SaaS company in Bangalore ASAP"
+    </div>
+</div>
+"""
+
+_SCENARIO_2_ENTITIES_HTML = """
+<div class="extraction-results">
+    <h4>🔍 Extracted Entities</h4>
+    <ul>
+        <li><strong>Industry:</strong> healthcare ✅</li>
+        <li><strong>Location:</strong> Bangalore ✅</li>
+        <li><strong>Roles:</strong> senior React developers ✅</li>
+        <li><strong>Urgency:</strong> urgent (ASAP) ✅</li>
+        <li><strong>Count:</strong> 5 positions ✅</li>
+        <li><strong>Skills:</strong> React, senior experience ✅</li>
+    </ul>
+    <p class="success-text"><strong>Extraction Score: 100% (6/6)</strong></p>
+</div>
+"""
+
+_SCENARIO_2_RESPONSE_HTML = """
+<div class="ai-response">
+    <h4>🤖 AI Agent Response</h4>
+    <p>"Perfect! I see you need 5 senior React developers for your healthcare SaaS company in Bangalore urgently. For this scale of hiring, I'd recommend our <strong>Bulk Hiring Solution</strong>.</p>
+    <p>This package is designed for multiple senior-level positions and includes:</p>
+    <ul>
+        <li>Dedicated team of 3 recruiters</li>
+        <li>Senior React developer specialization</li>
+        <li>Healthcare industry compliance knowledge</li>
+        <li>Bangalore tech hub connections</li>
+        <li>Parallel processing for faster results</li>
+    </ul>
+    <p>We can typically fill 5 senior positions within 3-4 weeks. Shall I prepare a comprehensive proposal?"</p>
+</div>
+"""
+
+_SCENARIO_3_CARD_HTML = """
+<div class="demo-card">
+    <h3>🤖 Scenario 3: AI/ML Startup</h3>
+    <div class="scenario-input">
+        💬 <strong>Client Input:</strong> "Looking for a data scientist with ML experience for our AI startup, remote work ok"
+    </div>
+</div>
+"""
+
+_SCENARIO_3_ENTITIES_HTML = """
+<div class="extraction-results">
+    <h4>🔍 Extracted Entities</h4>
+    <ul>
+        <li><strong>Industry:</strong> AI/ML ✅</li>
+        <li><strong>Location:</strong> Remote ✅</li>
+        <li><strong>Roles:</strong> data scientist ✅</li>
+        <li><strong>Skills:</strong> machine learning ✅</li>
+        <li><strong>Count:</strong> 1 position ✅</li>
+        <li><strong>Company Size:</strong> startup ✅</li>
+    </ul>
+    <p class="success-text"><strong>Extraction Score: 100% (6/6)</strong></p>
+</div>
+"""
+
+_SCENARIO_3_RESPONSE_HTML = """
+<div class="ai-response">
+    <h4>🤖 AI Agent Response</h4>
+    <p>"Excellent! You're looking for a data scientist with ML experience for your AI startup, and you're open to remote work. I'd recommend our <strong>Specialized Skills Hunt</strong> package.</p>
+    <p>This is perfect for niche AI/ML roles and includes:</p>
+    <ul>
+        <li>Global talent pool (remote-first)</li>
+        <li>ML/AI expertise screening</li>
+        <li>Technical assessment partnerships</li>
+        <li>Startup culture fit evaluation</li>
+        <li>Portfolio and project review</li>
+    </ul>
+    <p>We have a strong network of data scientists in the AI space. Would you like to discuss specific ML domains (NLP, computer vision, etc.) and I'll create a targeted search strategy?"</p>
+</div>
+"""
+
+_METRIC_ACCURACY_HTML = """
+<div class="demo-card" style="text-align: center;">
+    <div class="metric-large success-text">100%</div>
+    <h4>Extraction Accuracy</h4>
+    <p>Perfect entity detection across all scenarios</p>
+</div>
+"""
+
+_METRIC_RESPONSE_TIME_HTML = """
+<div class="demo-card" style="text-align: center;">
+    <div class="metric-large primary-text">&lt;0.5s</div>
+    <h4>Response Time</h4>
+    <p>Lightning-fast Groq LLM processing</p>
+</div>
+"""
+
+_METRIC_COST_HTML = """
+<div class="demo-card" style="text-align: center;">
+    <div class="metric-large success-text">FREE</div>
+    <h4>API Cost</h4>
+    <p>Groq provides generous free tier limits</p>
+</div>
+"""
+
+_METRIC_AVAILABILITY_HTML = """
+<div class="demo-card" style="text-align: center;">
+    <div class="metric-large primary-text">24/7</div>
+    <h4>Availability</h4>
+    <p>Always ready to handle client inquiries</p>
+</div>
+"""
+
+_FEATURE_INTELLIGENCE_HTML = """
+<div class="demo-card">
+    <h3>🧠 Intelligence</h3>
+    <ul>
+        <li>✅ Groq LLM with 70B parameters</li>
+        <li>✅ Fine-tuned for recruiting scenarios</li>
+        <li>✅ Context-aware conversation flow</li>
+        <li>✅ Multi-agent architecture</li>
+        <li>✅ Advanced entity extraction</li>
+    </ul>
+</div>
+"""
+
+_FEATURE_PERFORMANCE_HTML = """
+<div class="demo-card">
+    <h3>⚡ Performance</h3>
+    <ul>
+        <li>✅ Sub-second response times</li>
+        <li>✅ 100% extraction accuracy</li>
+        <li>✅ Real-time processing</li>
+        <li>✅ Scalable architecture</li>
+        <li>✅ 24/7 availability</li>
+    </ul>
+</div>
+"""
+
+_FEATURE_ECONOMICS_HTML = """
+<div class="demo-card">
+    <h3>💰 Economics</h3>
+    <ul>
+        <li>✅ FREE Groq API usage</li>
+        <li>✅ No per-conversation charges</li>
+        <li>✅ Generous rate limits</li>
+        <li>✅ Cost-effective scaling</li>
+        <li>✅ Transparent pricing</li>
+    </ul>
+</div>
+"""
+
+_FEATURE_TECHNOLOGY_HTML = """
+<div class="demo-card">
+    <h3>🔧 Technology</h3>
+    <ul>
+        <li>✅ Python/FastAPI backend</li>
+        <li>✅ Streamlit web interface</li>
+        <li>✅ SQLite database</li>
+        <li>✅ Docker containerization</li>
+        <li>✅ Cloud-ready deployment</li>
+    </ul>
+</div>
+"""
+
+_CALL_TO_ACTION_HTML = """
+<div class="demo-header" style="margin-top: 2rem;">
+    <h2>🚀 Ready to Experience the Full AI Agent?</h2>
+    <p style="font-size: 1.1rem; margin: 1rem 0;">
+        Try the live interactive version and see the AI Sales Agent in action!
+    </p>
+</div>
+"""
+
+_FOOTER_HTML = """
+<div style="text-align: center; color: #666; padding: 2rem;">
+    <p>🎯 AI Sales Agent Demo • Powered by Groq LLM • Built with ❤️</p>
+    <p>© 2025 • Intelligent Recruiting Solutions</p>
+</div>
+"""
+
+st.html(_CSS)
 
 def display_demo_header():
     """Display the demo header"""
-    st.markdown("""
-    <div class="demo-header">
-        <h1>🎯 AI Sales Agent Demo</h1>
-        <h2>See the Power of Intelligent Recruiting</h2>
-        <p style="font-size: 1.2rem; margin-top: 1rem;">
-            Experience 100% extraction accuracy • Lightning-fast responses • Professional conversation flow
-        </p>
-        <p style="opacity: 0.9;">Powered by Groq LLM with fine-tuned recruiting expertise</p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.html(_HEADER_HTML)
 
 def demo_scenario_1():
     """Fintech startup scenario"""
-    st.markdown("""
-    <div class="demo-card">
-        <h3>🏦 Scenario 1: Fintech Startup in Mumbai</h3>
-        <div class="scenario-input">
-            💬 <strong>Client Input:</strong> "We are a fintech startup in Mumbai hiring 2 backend engineers and a UI/UX designer urgently."
-        </div>
-    </div>
-    """, unsafe_allow_html=True)
+    st.html(_SCENARIO_1_CARD_HTML)
     
     col1, col2 = st.columns(2)
     
     with col1:
-        st.markdown("""
-        <div class="extraction-results">
-            <h4>🔍 Extracted Entities</h4>
-            <ul>
-                <li><strong>Industry:</strong> fintech ✅</li>
-                <li><strong>Location:</strong> Mumbai ✅</li>
-                <li><strong>Roles:</strong> backend engineer, UI/UX designer ✅</li>
-                <li><strong>Urgency:</strong> urgent ✅</li>
-                <li><strong>Count:</strong> 3 total positions ✅</li>
-                <li><strong>Company Size:</strong> startup ✅</li>
-            </ul>
-            <p class="success-text"><strong>Extraction Score: 100% (6/6)</strong></p>
-        </div>
-        """, unsafe_allow_html=True)
+        st.html(_SCENARIO_1_ENTITIES_HTML)
     
     with col2:
-        st.markdown("""
-        <div class="ai-response">
-            <h4>🤖 AI Agent Response</h4>
-            <p>"Great! I understand you're a fintech startup in Mumbai looking to hire urgently. Based on your requirements for 2 backend engineers and a UI/UX designer, I'd recommend our <strong>Tech Startup Hiring Pack</strong>.</p>
-            <p>This package specializes in fast-track hiring for growing fintech companies and includes:</p>
-            <ul>
-                <li>Pre-screened tech talent pool</li>
-                <li>Mumbai-specific candidate networks</li>
-                <li>Rapid 2-week placement timeline</li>
-                <li>Fintech experience matching</li>
-            </ul>
-            <p>Would you like me to prepare a detailed proposal with timeline and investment details?"</p>
-        </div>
-        """, unsafe_allow_html=True)
+        st.html(_SCENARIO_1_RESPONSE_HTML)
 
 def demo_scenario_2():
     """Healthcare scenario"""
-    st.markdown("""
-    <div class="demo-card">
-        <h3>🏥 Scenario 2: Healthcare SaaS Company</h3>
-        <div class="scenario-input">
-            💬 <strong>Client Input:</strong> "Need 5 senior React developers for our healthcare SaaS company in Bangalore ASAP"
-        </div>
-    </div>
-    """, unsafe_allow_html=True)
+    st.html(_SCENARIO_2_CARD_HTML)
     
     col1, col2 = st.columns(2)
     
     with col1:
-        st.markdown("""
-        <div class="extraction-results">
-            <h4>🔍 Extracted Entities</h4>
-            <ul>
-                <li><strong>Industry:</strong> healthcare ✅</li>
-                <li><strong>Location:</strong> Bangalore ✅</li>
-                <li><strong>Roles:</strong> senior React developers ✅</li>
-                <li><strong>Urgency:</strong> urgent (ASAP) ✅</li>
-                <li><strong>Count:</strong> 5 positions ✅</li>
-                <li><strong>Skills:</strong> React, senior experience ✅</li>
-            </ul>
-            <p class="success-text"><strong>Extraction Score: 100% (6/6)</strong></p>
-        </div>
-        """, unsafe_allow_html=True)
+        st.html(_SCENARIO_2_ENTITIES_HTML)
     
     with col2:
-        st.markdown("""
-        <div class="ai-response">
-            <h4>🤖 AI Agent Response</h4>
-            <p>"Perfect! I see you need 5 senior React developers for your healthcare SaaS company in Bangalore urgently. For this scale of hiring, I'd recommend our <strong>Bulk Hiring Solution</strong>.</p>
-            <p>This package is designed for multiple senior-level positions and includes:</p>
-            <ul>
-                <li>Dedicated team of 3 recruiters</li>
-                <li>Senior React developer specialization</li>
-                <li>Healthcare industry compliance knowledge</li>
-                <li>Bangalore tech hub connections</li>
-                <li>Parallel processing for faster results</li>
-            </ul>
-            <p>We can typically fill 5 senior positions within 3-4 weeks. Shall I prepare a comprehensive proposal?"</p>
-        </div>
-        """, unsafe_allow_html=True)
+        st.html(_SCENARIO_2_RESPONSE_HTML)
 
 def demo_scenario_3():
     """AI startup scenario"""
-    st.markdown("""
-    <div class="demo-card">
-        <h3>🤖 Scenario 3: AI/ML Startup</h3>
-        <div class="scenario-input">
-            💬 <strong>Client Input:</strong> "Looking for a data scientist with ML experience for our AI startup, remote work ok"
-        </div>
-    </div>
-    """, unsafe_allow_html=True)
+    st.html(_SCENARIO_3_CARD_HTML)
     
     col1, col2 = st.columns(2)
     
     with col1:
-        st.markdown("""
-        <div class="extraction-results">
-            <h4>🔍 Extracted Entities</h4>
-            <ul>
-                <li><strong>Industry:</strong> AI/ML ✅</li>
-                <li><strong>Location:</strong> Remote ✅</li>
-                <li><strong>Roles:</strong> data scientist ✅</li>
-                <li><strong>Skills:</strong> machine learning ✅</li>
-                <li><strong>Count:</strong> 1 position ✅</li>
-                <li><strong>Company Size:</strong> startup ✅</li>
-            </ul>
-            <p class="success-text"><strong>Extraction Score: 100% (6/6)</strong></p>
-        </div>
-        """, unsafe_allow_html=True)
+        st.html(_SCENARIO_3_ENTITIES_HTML)
     
     with col2:
-        st.markdown("""
-        <div class="ai-response">
-            <h4>🤖 AI Agent Response</h4>
-            <p>"Excellent! You're looking for a data scientist with ML experience for your AI startup, and you're open to remote work. I'd recommend our <strong>Specialized Skills Hunt</strong> package.</p>
-            <p>This is perfect for niche AI/ML roles and includes:</p>
-            <ul>
-                <li>Global talent pool (remote-first)</li>
-                <li>ML/AI expertise screening</li>
-                <li>Technical assessment partnerships</li>
-                <li>Startup culture fit evaluation</li>
-                <li>Portfolio and project review</li>
-            </ul>
-            <p>We have a strong network of data scientists in the AI space. Would you like to discuss specific ML domains (NLP, computer vision, etc.) and I'll create a targeted search strategy?"</p>
-        </div>
-        """, unsafe_allow_html=True)
+        st.html(_SCENARIO_3_RESPONSE_HTML)
 
 def display_performance_metrics():
     """Display impressive performance metrics"""
@@ -240,46 +363,22 @@ def display_performance_metrics():
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        st.markdown("""
-        <div class="demo-card" style="text-align: center;">
-            <div class="metric-large success-text">100%</div>
-            <h4>Extraction Accuracy</h4>
-            <p>Perfect entity detection across all scenarios</p>
-        </div>
-        """, unsafe_allow_html=True)
+        st.html(_METRIC_ACCURACY_HTML)
     
     with col2:
-        st.markdown("""
-        <div class="demo-card" style="text-align: center;">
-            <div class="metric-large primary-text"><0.5s</div>
-            <h4>Response Time</h4>
-            <p>Lightning-fast Groq LLM processing</p>
-        </div>
-        """, unsafe_allow_html=True)
+        st.html(_METRIC_RESPONSE_TIME_HTML)
     
     with col3:
-        st.markdown("""
-        <div class="demo-card" style="text-align: center;">
-            <div class="metric-large success-text">FREE</div>
-            <h4>API Cost</h4>
-            <p>Groq provides generous free tier limits</p>
-        </div>
-        """, unsafe_allow_html=True)
+        st.html(_METRIC_COST_HTML)
     
     with col4:
-        st.markdown("""
-        <div class="demo-card" style="text-align: center;">
-            <div class="metric-large primary-text">24/7</div>
-            <h4>Availability</h4>
-            <p>Always ready to handle client inquiries</p>
-        </div>
-        """, unsafe_allow_html=True)
+        st.html(_METRIC_AVAILABILITY_HTML)
 
-def display_accuracy_comparison():
-    """Display accuracy comparison chart"""
-    st.markdown("## 📈 Accuracy Comparison")
-    
-    # Sample data comparing different approaches
+@st.cache_resource(show_spinner=False)
+def _build_comparison_chart():
+    """Build the static accuracy comparison chart once per process"""
+    # Sample data comparing different approaches; built here rather than at module
+    # scope because this page script re-executes on every rerun
     comparison_data = pd.DataFrame({
         'Method': ['Manual Processing', 'Basic Chatbot', 'Rule-Based NER', 'Our AI Agent (Groq)'],
         'Accuracy': [60, 40, 75, 100],
@@ -287,47 +386,33 @@ def display_accuracy_comparison():
         'Cost_Effectiveness': [30, 95, 85, 100]
     })
     
-    fig = go.Figure()
-    
-    fig.add_trace(go.Scatter(
-        x=comparison_data['Method'],
-        y=comparison_data['Accuracy'],
-        mode='lines+markers',
-        name='Accuracy %',
-        line=dict(color='#28a745', width=4),
-        marker=dict(size=10)
-    ))
-    
-    fig.add_trace(go.Scatter(
-        x=comparison_data['Method'],
-        y=comparison_data['Speed'],
-        mode='lines+markers',
-        name='Speed %',
-        line=dict(color='#007bff', width=4),
-        marker=dict(size=10)
-    ))
-    
-    fig.add_trace(go.Scatter(
-        x=comparison_data['Method'],
-        y=comparison_data['Cost_Effectiveness'],
-        mode='lines+markers',
-        name='Cost Effectiveness %',
-        line=dict(color='#ffc107', width=4),
-        marker=dict(size=10)
-    ))
-    
-    fig.update_layout(
-        title="Performance Comparison: Our AI Agent vs Alternatives",
-        xaxis_title="Method",
-        yaxis_title="Performance %",
-        hovermode='x unified',
-        plot_bgcolor='rgba(0,0,0,0)',
-        paper_bgcolor='rgba(0,0,0,0)',
-        font=dict(size=14),
-        height=500
-    )
+    long_data = comparison_data.rename(columns={
+        'Accuracy': 'Accuracy %',
+        'Speed': 'Speed %',
+        'Cost_Effectiveness': 'Cost Effectiveness %'
+    }).melt(id_vars='Method', var_name='Metric', value_name='Performance %')
+    
+    # A 4x3 dataset doesn't need Plotly; Vega-Lite renders it natively
+    return alt.Chart(
+        long_data,
+        title="Performance Comparison: Our AI Agent vs Alternatives"
+    ).mark_line(point=alt.OverlayMarkDef(size=100), strokeWidth=4).encode(
+        x=alt.X('Method:N', sort=None, title="Method"),
+        y=alt.Y('Performance %:Q', title="Performance %"),
+        color=alt.Color(
+            'Metric:N',
+            sort=None,
+            scale=alt.Scale(range=['#28a745', '#007bff', '#ffc107']),
+            legend=alt.Legend(orient='top', title=None)
+        ),
+        tooltip=['Method', 'Metric', 'Performance %']
+    ).properties(height=500)
+
+def display_accuracy_comparison():
+    """Display accuracy comparison chart"""
+    st.markdown("## 📈 Accuracy Comparison")
     
-    st.plotly_chart(fig, use_container_width=True)
+    st.altair_chart(_build_comparison_chart(), use_container_width=True)
 
 def display_features():
     """Display key features"""
@@ -336,58 +421,14 @@ def display_features():
     col1, col2 = st.columns(2)
     
     with col1:
-        st.markdown("""
-        <div class="demo-card">
-            <h3>🧠 Intelligence</h3>
-            <ul>
-                <li>✅ Groq LLM with 70B parameters</li>
-                <li>✅ Fine-tuned for recruiting scenarios</li>
-                <li>✅ Context-aware conversation flow</li>
-                <li>✅ Multi-agent architecture</li>
-                <li>✅ Advanced entity extraction</li>
-            </ul>
-        </div>
-        """, unsafe_allow_html=True)
+        st.html(_FEATURE_INTELLIGENCE_HTML)
         
-        st.markdown("""
-        <div class="demo-card">
-            <h3>⚡ Performance</h3>
-            <ul>
-                <li>✅ Sub-second response times</li>
-                <li>✅ 100% extraction accuracy</li>
-                <li>✅ Real-time processing</li>
-                <li>✅ Scalable architecture</li>
-                <li>✅ 24/7 availability</li>
-            </ul>
-        </div>
-        """, unsafe_allow_html=True)
+        st.html(_FEATURE_PERFORMANCE_HTML)
     
     with col2:
-        st.markdown("""
-        <div class="demo-card">
-            <h3>💰 Economics</h3>
-            <ul>
-                <li>✅ FREE Groq API usage</li>
-                <li>✅ No per-conversation charges</li>
-                <li>✅ Generous rate limits</li>
-                <li>✅ Cost-effective scaling</li>
-                <li>✅ Transparent pricing</li>
-            </ul>
-        </div>
-        """, unsafe_allow_html=True)
+        st.html(_FEATURE_ECONOMICS_HTML)
         
-        st.markdown("""
-        <div class="demo-card">
-            <h3>🔧 Technology</h3>
-            <ul>
-                <li>✅ Python/FastAPI backend</li>
-                <li>✅ Streamlit web interface</li>
-                <li>✅ SQLite database</li>
-                <li>✅ Docker containerization</li>
-                <li>✅ Cloud-ready deployment</li>
-            </ul>
-        </div>
-        """, unsafe_allow_html=True)
+        st.html(_FEATURE_TECHNOLOGY_HTML)
 
 def main():
     """Main demo page"""
@@ -396,31 +437,33 @@ def main():
     # Interactive demo scenarios
     st.markdown("## 🎭 Interactive Demo Scenarios")
     
-    demo_scenario_1()
-    st.markdown("---")
-    demo_scenario_2() 
-    st.markdown("---")
-    demo_scenario_3()
+    # st.tabs executes every tab body on each rerun, so only the selected scenario is built
+    scenario = st.radio(
+        "Scenario", ["🏦 Fintech", "🏥 Healthcare", "🤖 AI/ML"],
+        key="demo_scenario", horizontal=True, label_visibility="collapsed"
+    )
+    
+    if scenario == "🏦 Fintech":
+        demo_scenario_1()
+    elif scenario == "🏥 Healthcare":
+        demo_scenario_2()
+    else:
+        demo_scenario_3()
     
     st.markdown("---")
     display_performance_metrics()
     
     st.markdown("---")
-    display_accuracy_comparison()
+    # A collapsed expander still runs its body; the toggle skips the chart until it's wanted
+    if st.toggle("📈 Show accuracy comparison chart", key="show_comparison_chart"):
+        display_accuracy_comparison()
     
     st.markdown("---")
     display_features()
     
     # Call to action
     st.markdown("---")
-    st.markdown("""
-    <div class="demo-header" style="margin-top: 2rem;">
-        <h2>🚀 Ready to Experience the Full AI Agent?</h2>
-        <p style="font-size: 1.1rem; margin: 1rem 0;">
-            Try the live interactive version and see the AI Sales Agent in action!
-        </p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.html(_CALL_TO_ACTION_HTML)
     
     col1, col2, col3 = st.columns([1, 2, 1])
     
@@ -431,12 +474,7 @@ def main():
     
     # Footer
     st.markdown("---")
-    st.markdown("""
-    <div style="text-align: center; color: #666; padding: 2rem;">
-        <p>🎯 AI Sales Agent Demo • Powered by Groq LLM • Built with ❤️</p>
-        <p>© 2025 • Intelligent Recruiting Solutions</p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.html(_FOOTER_HTML)
 
 if __name__ == "__main__":
     main()
@@ -3,11 +3,38 @@ Flask-based AI Sales Agent UI
 Modern chat interface with real-time features
 """
 
-from flask import Flask, render_template, request, jsonify, session
+if __name__ == '__main__':
+    try:
+        # Run directly: patch before anything else imports the stdlib. Importing this
+        # module never patches; launch_flask.py and `gunicorn -k eventlet` do it up front.
+        import eventlet
+        eventlet.monkey_patch()
+    except ImportError:  # pragma: no cover - optional dependency
+        pass
+
+try:
+    # Optional: cooperative worker so a slow LLM call doesn't stall other clients,
+    # used only when whoever started the process has already monkey-patched
+    import eventlet.patcher
+    ASYNC_MODE = "eventlet" if eventlet.patcher.is_monkey_patched("socket") else "threading"
+except ImportError:  # pragma: no cover - optional dependency
+    ASYNC_MODE = "threading"
+
+from flask import Flask, Response, render_template, request, jsonify, session, stream_with_context
+from flask.json.provider import DefaultJSONProvider
 from flask_socketio import SocketIO, emit
+from jinja2 import FileSystemBytecodeCache
 import json
+import logging
+import re
+import threading
+import time
 import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+from statistics import fmean
 import sys
 import os
 
@@ -18,29 +45,206 @@ from main import EnhancedAISalesAgent
 from services.llm_service import LLMService
 from services.advanced_ner import create_advanced_ner_service
 
+try:
+    import orjson  # Optional: faster JSON encoding for API responses
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
 app = Flask(__name__)
 app.config['SECRET_KEY'] = 'your-secret-key-here'
-socketio = SocketIO(app, cors_allowed_origins="*")
+socketio = SocketIO(app, async_mode=ASYNC_MODE, cors_allowed_origins="*")
+
+# Persist compiled templates across restarts and compile both UIs up front.
+# Template auto-reload follows app.debug, so it is off unless debugging.
+# With no directory, Jinja uses a per-user 0700 temp dir and checks its owner,
+# so other local users can't plant bytecode for us to load.
+app.jinja_env.bytecode_cache = FileSystemBytecodeCache()
+for _template in ('chat.html', 'new_chat.html'):
+    app.jinja_env.get_template(_template)
+
+if orjson is not None:
+    class OrjsonProvider(DefaultJSONProvider):
+        """Flask JSON provider backed by orjson"""
+
+        def dumps(self, obj, **kwargs):
+            return orjson.dumps(
+                obj,
+                default=self.default,
+                # Non-str dict keys are stringified as the stdlib encoder does, not a TypeError
+                option=orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+            ).decode()
+
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+
+    app.json = OrjsonProvider(app)
+
+# Phrases that signal the user wants to end the conversation
+_END_RE = re.compile(
+    r"\b(goodbye|bye|thanks|thank\s+you|that'?s\s+all|end\s+chat|finish|done|complete)\b",
+    re.IGNORECASE
+)
+
+# Client-generated ids for background chat jobs
+_REQUEST_ID_RE = re.compile(r'^[0-9A-Za-z]{8,64}$')
+
+# System status is polled frequently but changes slowly
+STATUS_TTL_SECONDS = 1.5
+_STATUS_CACHE = {'ts': 0.0, 'data': None}
+
+# NER runs alongside the agent on this pool
+_pool = ThreadPoolExecutor(max_workers=4)
+NER_TIMEOUT_SECONDS = 10
 
 # Global instances
 agent = None
 llm_service = None
 ner_service = None
 
+@lru_cache(maxsize=1)
+def get_agent():
+    """Process-wide AI Sales Agent instance"""
+    return EnhancedAISalesAgent()
+
+@lru_cache(maxsize=1)
+def get_llm_service():
+    """Process-wide LLM service instance"""
+    return LLMService()
+
+@lru_cache(maxsize=1)
+def get_ner_service():
+    """Process-wide NER service instance"""
+    return create_advanced_ner_service(get_llm_service())
+
 def initialize_agent():
     """Initialize the AI Sales Agent"""
     global agent, llm_service, ner_service
     try:
-        agent = EnhancedAISalesAgent()
-        llm_service = LLMService()
-        ner_service = create_advanced_ner_service(llm_service)
+        agent = get_agent()
+        llm_service = get_llm_service()
+        ner_service = get_ner_service()
         return True
     except Exception as e:
         print(f"Failed to initialize agent: {e}")
         return False
 
-# Initialize on startup
-initialize_agent()
+# Successful LLM extractions by normalized message, least recently used evicted first
+EXTRACTION_CACHE_SIZE = 1024
+_extraction_cache = OrderedDict()
+_extraction_cache_lock = threading.Lock()
+
+def _cached_extraction(message):
+    """Entity extraction for a normalized message, as a JSON-ready dict (no timestamp)"""
+    with _extraction_cache_lock:
+        data = _extraction_cache.get(message)
+        if data is not None:
+            _extraction_cache.move_to_end(message)
+            return data
+    extraction_result = ner_service.extract_entities(message)
+    scores = extraction_result.confidence_scores
+    avg_conf = fmean(scores.values()) if scores else 0.8
+    data = {
+        'entities': extraction_result.entities,
+        'method': extraction_result.extraction_method,
+        'confidence': avg_conf
+    }
+    # Rule-based and empty results are what the service falls back to when the LLM call
+    # fails; memoizing them would pin a transient error for that message
+    if data['method'] == 'llm':
+        with _extraction_cache_lock:
+            _extraction_cache[message] = data
+            if len(_extraction_cache) > EXTRACTION_CACHE_SIZE:
+                _extraction_cache.popitem(last=False)
+    return data
+
+def extract_message_entities(message):
+    """Extract entities, reusing results for repeated messages (retries, reconnects)"""
+    # Whitespace only: case carries meaning for names and locations
+    data = _cached_extraction(' '.join(message.split()))
+    return {**data, 'timestamp': datetime.utcnow().isoformat()}
+
+def _compact_transcript(messages, max_chars_per_msg=400, max_total_chars=6000):
+    """Build a summary transcript from the newest messages within a character budget.
+
+    Whitespace is collapsed, long messages are truncated, consecutive repeats are
+    dropped, and older messages are cut once the budget is spent.
+    """
+    lines = []
+    total = 0
+    previous = None
+    for msg in reversed(messages):
+        content = ' '.join((msg.get('content') or '').split())
+        if not content or content == previous:
+            continue
+        previous = content
+        if len(content) > max_chars_per_msg:
+            content = content[:max_chars_per_msg - 1].rstrip() + '…'
+        line = f"{(msg.get('role') or '').upper()}: {content}"
+        total += len(line) + 1
+        if total > max_total_chars:
+            break
+        lines.append(line)
+    return '\n'.join(reversed(lines))
+
+def _sse(payload):
+    """Format one server-sent event frame"""
+    return f"data: {json.dumps(payload)}\n\n"
+
+def _stream_llm(prompt, prefix='', suffix='', **final):
+    """Yield SSE frames for each LLM output delta, then a closing 'done' frame (with 'error' if the stream broke)"""
+    if prefix:
+        yield _sse({'delta': prefix})
+    try:
+        for delta in llm_service.generate_stream(prompt):
+            yield _sse({'delta': delta})
+    except Exception as e:
+        # The provider failed mid-answer; close the stream with an error instead of a half reply
+        logger.warning("LLM stream failed: %s", e)
+        yield _sse({'done': True, 'error': 'The response was interrupted. Please try again.', **final})
+        return
+    if suffix:
+        yield _sse({'delta': suffix})
+    yield _sse({'done': True, **final})
+
+def _event_stream(frames):
+    """Wrap an SSE frame generator in an unbuffered streaming response"""
+    return Response(
+        stream_with_context(frames),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+
+def _run_chat_job(request_id, agent_session_id, message, sid):
+    """Process a chat turn off the request thread and push the result to the client's socket"""
+    ner_future = _pool.submit(extract_message_entities, message) if ner_service else None
+    try:
+        result = agent.process_message(agent_session_id, message)
+    except Exception as e:
+        logger.warning("Background chat job failed: %s", e)
+        socketio.emit('chat_done', {'request_id': request_id, 'error': str(e)}, to=sid)
+        return
+
+    extraction_data = None
+    try:
+        if ner_future:
+            extraction_data = ner_future.result(timeout=NER_TIMEOUT_SECONDS)
+    except Exception as e:
+        logger.warning("Extraction error: %s", e)
+
+    socketio.emit('chat_done', {
+        'request_id': request_id,
+        'response': result.get('response', 'I understand. Could you tell me more?'),
+        'extraction': extraction_data,
+        'timestamp': datetime.utcnow().isoformat()
+    }, to=sid)
+
+@app.before_request
+def ensure_initialized():
+    """Initialize lazily so the Werkzeug reloader's watcher process never builds the agent"""
+    if agent is None:
+        initialize_agent()
 
 @app.route('/')
 def index():
@@ -60,8 +264,13 @@ def new_ui():
 def system_status():
     """Get system status"""
     if agent:
-        status = agent.get_system_status()
-        return jsonify(status)
+        now = time.monotonic()
+        if _STATUS_CACHE['data'] is None or now - _STATUS_CACHE['ts'] > STATUS_TTL_SECONDS:
+            _STATUS_CACHE['data'] = agent.get_system_status()
+            _STATUS_CACHE['ts'] = now
+        response = jsonify(_STATUS_CACHE['data'])
+        response.add_etag()
+        return response.make_conditional(request)
     return jsonify({'error': 'Agent not initialized'}), 500
 
 @app.route('/api/chat', methods=['POST'])
@@ -76,51 +285,70 @@ def chat():  # supports new UI conversation_id while keeping legacy behavior
             return jsonify({'error': 'Agent not initialized'}), 500
 
         # Check if user wants to end conversation
-        end_keywords = ['goodbye', 'bye', 'thanks', 'thank you', 'that\'s all', 'end chat', 'finish', 'done', 'complete']
-        if any(keyword in message.lower() for keyword in end_keywords):
+        if _END_RE.search(message):
             # Auto-summarize before ending
             try:
                 if 'agent_session_id' in session:
-                    # Get conversation history for summary
-                    from services.memory_service import MemoryService
-                    memory = MemoryService()
-                    history = memory.get_conversation_history(session['agent_session_id'])
+                    # Get conversation history for summary from the agent's own store
+                    history = agent.memory_service.get_conversation_history(session['agent_session_id'], limit=20)
                     
                     if len(history) > 2:  # Only summarize if there's substantial conversation
-                        messages = [{'role': msg['role'], 'content': msg['content']} for msg in history]
-                        transcript = '\n'.join([f"{m['role'].upper()}: {m['content']}" for m in messages[-20:]])
+                        transcript = _compact_transcript(history)
                         
                         summary_prompt = (
                             "Provide a final summary of this recruiting conversation. Include: "
                             "1) Client's hiring needs 2) Positions requested 3) Timeline 4) Next steps discussed. "
                             "Keep it professional and concise.\n\nConversation:\n" + transcript
                         )
+                        opening = "Thank you for your time! Here's a summary of our discussion:\n\n"
+                        closing = "\n\nFeel free to reach out anytime for your hiring needs."
+                        if data.get('stream'):
+                            return _event_stream(_stream_llm(
+                                summary_prompt, prefix=opening, suffix=closing,
+                                extraction=None,
+                                timestamp=datetime.utcnow().isoformat(),
+                                conversation_ended=True
+                            ))
                         summary = llm_service.generate(summary_prompt)
                         
                         return jsonify({
-                            'response': f"Thank you for your time! Here's a summary of our discussion:\n\n{summary}\n\nFeel free to reach out anytime for your hiring needs.",
+                            'response': f"{opening}{summary}{closing}",
                             'extraction': None,
                             'timestamp': datetime.utcnow().isoformat(),
                             'conversation_ended': True
                         })
             except Exception as e:
-                print(f"Auto-summary error: {e}")
+                logger.warning("Auto-summary error: %s", e)
+
+        # Clients with a socket get an immediate 202 and the reply as a 'chat_done' event.
+        # Only ongoing sessions qualify: starting one has to set the session cookie here.
+        socket_id = data.get('socket_id')
+        ongoing = 'agent_session_id' in session and (conversation_id or 'conversation_started' in session)
+        if socket_id and ongoing:
+            # The client registers its own id before posting so an early 'chat_done' still matches
+            request_id = data.get('request_id')
+            if not isinstance(request_id, str) or not _REQUEST_ID_RE.match(request_id):
+                request_id = uuid.uuid4().hex
+            socketio.start_background_task(_run_chat_job, request_id, session['agent_session_id'], message, socket_id)
+            return jsonify({'request_id': request_id}), 202
+
+        # Entity extraction only needs the raw message, so run it while the agent responds
+        ner_future = _pool.submit(extract_message_entities, message) if ner_service else None
 
         # Legacy single-session flow (no conversation_id supplied)
         if not conversation_id:
             if 'conversation_started' not in session:
                 result = agent.start_conversation(message)
-                print(f"DEBUG: start_conversation result: {result}")
+                logger.debug("start_conversation result: %s", result)
                 session['conversation_started'] = True
                 session['agent_session_id'] = result.get('session_id')
                 response_text = result.get('response', 'Hello! How can I help with your hiring needs?')
             else:
                 result = agent.process_message(session['agent_session_id'], message)
-                print(f"DEBUG: process_message result: {result}")
-                print(f"DEBUG: session_id: {session.get('agent_session_id')}")
+                logger.debug("process_message result: %s (session_id: %s)", result, session.get('agent_session_id'))
                 response_text = result.get('response', 'I understand. Could you tell me more?')
                 if not result.get('response'):
-                    print(f"DEBUG: No response in result, full result: {result}")
+                    logger.debug("No response in result, full result: %s", result)
         else:
             # For multi-conversation UI we currently map all to a single backend agent session
             if 'agent_session_id' not in session:
@@ -133,20 +361,10 @@ def chat():  # supports new UI conversation_id while keeping legacy behavior
 
         extraction_data = None
         try:
-            if ner_service:
-                extraction_result = ner_service.extract_entities(message)
-                if extraction_result.confidence_scores:
-                    avg_conf = sum(extraction_result.confidence_scores.values()) / len(extraction_result.confidence_scores)
-                else:
-                    avg_conf = 0.8
-                extraction_data = {
-                    'entities': extraction_result.entities,
-                    'method': extraction_result.extraction_method,
-                    'confidence': avg_conf,
-                    'timestamp': datetime.utcnow().isoformat()
-                }
+            if ner_future:
+                extraction_data = ner_future.result(timeout=NER_TIMEOUT_SECONDS)
         except Exception as e:
-            print(f"Extraction error: {e}")
+            logger.warning("Extraction error: %s", e)
 
         return jsonify({
             'response': response_text,
@@ -158,7 +376,12 @@ def chat():  # supports new UI conversation_id while keeping legacy behavior
 
 @app.route('/api/summarize', methods=['POST'])
 def summarize():
-    """Summarize a conversation (client sends messages array)."""
+    """Summarize a conversation (client sends messages array).
+
+    With ``"stream": true`` in the body the summary is sent as server-sent
+    events (``{"delta": ...}`` frames, then ``{"done": true}``, carrying
+    ``"error"`` if the model stream broke partway).
+    """
     try:
         data = request.json or {}
         messages = data.get('messages', [])
@@ -168,19 +391,15 @@ def summarize():
         user_visible = [m for m in messages if m.get('role') in ('user','assistant')]
         if len(user_visible) < 2:  # need at least one user + one assistant ideally
             return jsonify({'summary': 'Not enough conversation content to summarize yet.'})
-        # Build compact transcript
-        transcript = []
-        for m in user_visible[-30:]:  # limit for token economy
-            role = m.get('role')
-            content = (m.get('content') or '').strip().replace('\n',' ')
-            if content:
-                transcript.append(f"{role.upper()}: {content}")
-        joined = '\n'.join(transcript)
+        # Build compact transcript, limited for token economy
+        joined = _compact_transcript(user_visible[-30:])
         prompt = (
             "You are an expert recruiting operations analyst. Summarize the following recruiting conversation. "
             "Provide structured bullet sections: 1) Hiring Requirements 2) Roles & Headcount 3) Key Skills/Tech 4) Timeline & Urgency 5) Budget or Constraints (if any) 6) Proposed Next Actions 7) Open Questions to Clarify 8) Extracted Entities (company, roles, location, industry). Be concise, no fluff.\n\nConversation Transcript:\n" + joined + "\n\nStructured Summary:" )
         if not llm_service:
             return jsonify({'summary': 'LLM service unavailable'}), 503
+        if data.get('stream'):
+            return _event_stream(_stream_llm(prompt))
         summary_text = llm_service.generate(prompt)
         return jsonify({'summary': summary_text})
     except Exception as e:  # pragma: no cover
@@ -215,4 +434,4 @@ def on_typing(data):
     emit('typing', data, broadcast=True, include_self=False)
 
 if __name__ == '__main__':
-    socketio.run(app, debug=True, host='0.0.0.0', port=5000)
+    socketio.run(app, debug=os.environ.get('FLASK_DEBUG') == '1', host='0.0.0.0', port=5000)
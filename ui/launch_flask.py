@@ -3,28 +3,40 @@
 Launch script for Flask-based AI Sales Agent UI
 """
 
+try:
+    # Optional: cooperative worker so a slow LLM call doesn't stall other clients.
+    # Must patch the stdlib before anything else imports it.
+    import eventlet
+    eventlet.monkey_patch()
+except ImportError:  # pragma: no cover - optional dependency
+    pass
+
 import sys
 import os
 
 # Add project root to path
 sys.path.append('/Users/vidhusinha/Desktop/Project')
 
-from ui.flask_app import app, socketio
+from ui.flask_app import app, socketio, ASYNC_MODE
 
 if __name__ == '__main__':
+    # Debug (reloader, template auto-reload, debugger) only when explicitly requested
+    debug = os.environ.get("FLASK_DEBUG") == "1"
+    
     print("🚀 Starting Flask AI Sales Agent UI...")
     print("📊 Features: Real-time chat, WebSocket support, Modern UI")
     print("🌐 Access at: http://localhost:5000")
     print("🔗 Network access: http://0.0.0.0:5000")
+    print(f"⚙️  Async mode: {ASYNC_MODE} | Debug: {'on' if debug else 'off (set FLASK_DEBUG=1)'}")
     print("-" * 50)
     
     try:
         socketio.run(
             app, 
-            debug=True, 
+            debug=debug, 
             host='0.0.0.0', 
             port=5000,
-            allow_unsafe_werkzeug=True
+            allow_unsafe_werkzeug=True  # Only used when eventlet is not installed
         )
     except KeyboardInterrupt:
         print("\n🛑 Server stopped by user")
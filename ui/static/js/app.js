@@ -9,6 +9,7 @@ class ChatApp {
         this.currentTab = 'chat';
         this.messages = [];
         this.extractions = [];
+        this.pendingRequests = new Set();
         
         this.init();
     }
@@ -103,6 +104,21 @@ class ChatApp {
         this.socket.on('typing', (data) => {
             this.showTypingIndicator(data.isTyping);
         });
+
+        // Replies to messages the server processed in the background
+        this.socket.on('chat_done', (data) => {
+            if (!this.pendingRequests.delete(data.request_id)) return;
+            this.showTypingIndicator(false);
+            if (data.error) {
+                this.showError('Failed to send message: ' + data.error);
+                return;
+            }
+            this.addMessage('assistant', data.response, data.timestamp);
+            if (data.extraction) {
+                this.addExtraction(data.extraction);
+            }
+            this.updateStats();
+        });
     }
 
     async loadSystemStatus() {
@@ -137,6 +153,14 @@ class ChatApp {
         }
     }
 
+    newRequestId() {
+        // randomUUID is only exposed in secure contexts (HTTPS or localhost)
+        if (window.crypto && typeof window.crypto.randomUUID === 'function') {
+            return window.crypto.randomUUID().replace(/-/g, '');
+        }
+        return Date.now().toString(16) + Math.random().toString(16).slice(2);
+    }
+
     async sendMessage() {
         const input = document.getElementById('messageInput');
         const message = input.value.trim();
@@ -154,18 +178,32 @@ class ChatApp {
         this.showTypingIndicator(true);
         this.showLoading(true);
 
+        // Registered before the POST: a fast background job can emit 'chat_done'
+        // before the 202 response has even been parsed
+        const requestId = this.newRequestId();
+        this.pendingRequests.add(requestId);
+
+        let pending = false;
         try {
             const response = await fetch('/api/chat', {
                 method: 'POST',
                 headers: {
                     'Content-Type': 'application/json',
                 },
-                body: JSON.stringify({ message })
+                body: JSON.stringify({
+                    message,
+                    request_id: requestId,
+                    socket_id: this.socket.connected ? this.socket.id : null
+                })
             });
 
             const data = await response.json();
 
-            if (response.ok) {
+            if (response.status === 202) {
+                // Accepted for background processing; the reply arrives as 'chat_done'
+                // unless 'chat_done' already arrived and cleared it
+                pending = this.pendingRequests.has(requestId);
+            } else if (response.ok) {
                 // Hide typing indicator
                 this.showTypingIndicator(false);
                 
@@ -186,7 +224,10 @@ class ChatApp {
             this.showError('Network error occurred');
         } finally {
             this.showLoading(false);
-            this.showTypingIndicator(false);
+            if (!pending) {
+                this.pendingRequests.delete(requestId);
+                this.showTypingIndicator(false);
+            }
         }
     }
 
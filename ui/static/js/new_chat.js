@@ -108,9 +108,10 @@
     if(state.sending) return; const text = els.input.value.trim(); if(!text) return;
     addMessage('user', text); els.input.value=''; resizeTextarea();
     state.sending = true; toggleLoading(true);
-    fetch('/api/chat', { method:'POST', headers:{'Content-Type':'application/json'}, body: JSON.stringify({ message: text, conversation_id: state.currentId }) })
-      .then(r=>r.json().then(j=>({ok:r.ok, j})))
-      .then(({ok,j})=>{
+    fetch('/api/chat', { method:'POST', headers:{'Content-Type':'application/json'}, body: JSON.stringify({ message: text, conversation_id: state.currentId, stream: state.settings.streaming }) })
+      .then(r=> isEventStream(r) ? streamIntoMessage(r).then(f=>{ if(f.error) toast(f.error,'error'); return null; }) : r.json().then(j=>({ok:r.ok, j})))
+      .then(res=>{
+        if(!res) return; const {ok,j} = res;
         if(!ok){ toast(j.error||'Error','error'); return; }
         addMessage('assistant', j.response, j.extraction ? {entities: j.extraction.entities, confidence: j.extraction.confidence} : null);
       })
@@ -121,9 +122,10 @@
   function summarize(){
     const convo = state.conversations[state.currentId]; if(!convo || !convo.messages.length){ toast('Nothing to summarize','error'); return; }
     toggleLoading(true);
-    fetch('/api/summarize', { method:'POST', headers:{'Content-Type':'application/json'}, body: JSON.stringify({ messages: convo.messages }) })
-      .then(r=>r.json().then(j=>({ok:r.ok, j})))
-      .then(({ok,j})=>{
+    fetch('/api/summarize', { method:'POST', headers:{'Content-Type':'application/json'}, body: JSON.stringify({ messages: convo.messages, stream: state.settings.streaming }) })
+      .then(r=> isEventStream(r) ? streamIntoMessage(r).then(f=>{ if(f.error) toast(f.error,'error'); return null; }) : r.json().then(j=>({ok:r.ok, j})))
+      .then(res=>{
+        if(!res) return; const {ok,j} = res;
         if(!ok){ toast(j.error||'Summarize error','error'); return; }
         addMessage('assistant', j.summary || '(no summary)');
       })
@@ -131,6 +133,46 @@
       .finally(()=> toggleLoading(false));
   }
 
+  function isEventStream(r){ return (r.headers.get('Content-Type')||'').startsWith('text/event-stream'); }
+
+  function insideFence(t){ return ((t.match(/```/g)||[]).length % 2) === 1; }
+
+  // Stream server-sent {delta} frames into a new assistant bubble. Paragraphs that are
+  // complete (closed by a blank line, outside a code fence) are rendered once and frozen;
+  // only the trailing block is re-rendered on each delta.
+  async function streamIntoMessage(resp){
+    if(!state.currentId) newConversation();
+    const convo = state.conversations[state.currentId];
+    const msg = { role: 'assistant', content: '', timestamp: new Date().toISOString() };
+    convo.messages.push(msg);
+    addMessageElement('assistant', '', msg.timestamp);
+    const content = els.chatScroll.lastElementChild.querySelector('.content');
+    const stable = document.createElement('span'); const tail = document.createElement('span');
+    content.append(stable, tail);
+    const reader = resp.body.getReader(); const decoder = new TextDecoder();
+    let buffer = '', stableLen = 0, final = {};
+    while(true){
+      const { value, done } = await reader.read(); if(done) break;
+      buffer += decoder.decode(value, { stream: true });
+      const frames = buffer.split('\n\n'); buffer = frames.pop();
+      frames.forEach(frame => {
+        if(!frame.startsWith('data: ')) return;
+        const evt = JSON.parse(frame.slice(6));
+        if(evt.done){ final = evt; return; }
+        msg.content += evt.delta;
+        const cut = msg.content.lastIndexOf('\n\n') + 2;
+        if(cut > stableLen + 1 && !insideFence(msg.content.slice(0, cut))){
+          stable.insertAdjacentHTML('beforeend', renderMarkdown(msg.content.slice(stableLen, cut)));
+          stableLen = cut;
+        }
+      });
+      tail.innerHTML = renderMarkdown(msg.content.slice(stableLen));
+      els.chatScroll.scrollTop = els.chatScroll.scrollHeight;
+    }
+    renderConversationList();
+    return final;
+  }
+
   function exportConversation(){
     const convo = state.conversations[state.currentId]; if(!convo){ toast('No conversation','error'); return; }
     const blob = new Blob([JSON.stringify(convo,null,2)], {type:'application/json'});
@@ -163,6 +205,7 @@
     els.btnSummarize.addEventListener('click', summarize);
     els.btnExport.addEventListener('click', exportConversation);
     els.btnTheme.addEventListener('click', toggleTheme);
+    els.cfgStreaming.addEventListener('change', e=>{ state.settings.streaming = e.target.checked; });
     els.quickPrompts.addEventListener('click', e=>{ if(e.target.dataset.prompt){ els.input.value=e.target.dataset.prompt; resizeTextarea(); send(); }});
     els.btnUpload.addEventListener('click', ()=> els.fileUpload.click());
     els.fileUpload.addEventListener('change', handleFileUpload);
@@ -4,17 +4,38 @@ Beautiful, professional interface for recruiting conversations
 """
 
 import streamlit as st
+import hashlib
 import json
 import time
 from datetime import datetime
-from typing import Dict, Any, List, Optional
-import uuid
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+import secrets
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 import plotly.express as px
 import plotly.graph_objects as go
 import pandas as pd
-from io import StringIO
 import re
 import asyncio
+import os
+import sys
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Imported rather than defined here: this script re-executes on every rerun, and a class
+# defined in it would be a new object each time while older messages keep the old one
+from models.message import Message
+
+try:
+    import mistune
+except ImportError:  # pragma: no cover - optional dependency
+    mistune = None
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
 
 # Configure page
 st.set_page_config(
@@ -25,8 +46,9 @@ st.set_page_config(
 )
 
 # Custom CSS for professional styling
-def inject_css(dark: bool = False):
-    """Inject theme-aware CSS with modern chat aesthetics."""
+@st.cache_data(show_spinner=False)
+def _build_css(dark: bool) -> str:
+    """Build the theme stylesheet once per theme."""
     if dark:
         vars = {
             'bg_body': '#0f1115', 'bg_panel': '#171a21', 'bg_accent': '#20242c', 'border': '#2d3748',
@@ -41,7 +63,7 @@ def inject_css(dark: bool = False):
             'user_bubble': 'linear-gradient(135deg,#6366f1,#8b5cf6)', 'assistant_bubble': '#ffffff', 'code_bg': '#f0f3f9',
             'assistant_text': '#1f2937'
         }
-    st.markdown(f"""
+    return f"""
     <style>
         html, body .block-container {{padding-top: 1.2rem;}}
         body {{background:{vars['bg_body']}; color:{vars['text']};}}
@@ -66,6 +88,9 @@ def inject_css(dark: bool = False):
         .bubble strong, .bubble em {{color:{vars['assistant_text']};}}
         .bubble a {{color:{vars['primary']};}}
         .meta {{font-size:.65rem; opacity:.65; margin-top:.35rem; text-transform:uppercase; letter-spacing:.05em;}}
+        [data-testid='stChatMessage'] {{background:{vars['bg_panel']}; border:1px solid {vars['border']}; border-radius:14px; animation: fadeInUp .3s ease;}}
+        [data-testid='stChatMessageAvatarUser'] {{background:{vars['primary_grad']}; color:#fff;}}
+        [data-testid='stChatMessageAvatarAssistant'] {{background:#0ea5e9; color:#fff;}}
         .typing-indicator {{display:flex; align-items:center; gap:.4rem; opacity:.7; font-style:italic;}}
         .typing-dots {{display:inline-block;}} .typing-dots::after {{content:'...'; animation: ellipsis 1.5s infinite;}}
         @keyframes ellipsis {{0%, 50% {{opacity: 1;}} 100% {{opacity: .3;}}}}
@@ -91,7 +116,12 @@ def inject_css(dark: bool = False):
         .streaming-text {{animation: fadeInChar .05s ease forwards;}}
         @keyframes fadeInChar {{from {{opacity:0;}} to {{opacity:1;}}}}
     </style>
-    """, unsafe_allow_html=True)
+    """
+
+def inject_css(dark: bool = False):
+    """Inject theme-aware CSS with modern chat aesthetics."""
+    # Streamlit drops elements a rerun does not re-emit, so the style block is sent every run
+    st.markdown(_build_css(dark), unsafe_allow_html=True)
 
 
 # Theme state & CSS injection
@@ -117,7 +147,7 @@ if "summary" not in st.session_state:
 if "last_gap_prompt" not in st.session_state:
     st.session_state.last_gap_prompt = None
 if "conversations" not in st.session_state:
-    st.session_state.conversations = {}
+    st.session_state.conversations = OrderedDict()
 if "active_conversation" not in st.session_state:
     st.session_state.active_conversation = None
 if "quick_prompts" not in st.session_state:
@@ -134,31 +164,59 @@ if "model_settings" not in st.session_state:
         "show_typing": True
     }
 if "conversation_titles" not in st.session_state:
-    st.session_state.conversation_titles = {}
-if "is_typing" not in st.session_state:
-    st.session_state.is_typing = False
+    st.session_state.conversation_titles = OrderedDict()
+if "window_size" not in st.session_state:
+    st.session_state.window_size = 40
 
-REQUIRED_FIELDS = [
+# Saved conversations beyond this many are evicted least-recently-used first
+MAX_CONVERSATIONS = 20
+
+REQUIRED_FIELDS = (
     "roles", "location", "industry", "experience_level", "skills",
     "headcount", "urgency", "budget", "timeline", "remote"
-]
+)
 
-def render_markdown(text: str) -> str:
+# Simulated streaming hands st.write_stream STREAM_CHUNK_CHARS characters at a time
+STREAM_CHUNK_CHARS = 8
+# Upper bound on the simulated reveal so long replies don't take longer to show than to generate
+STREAM_MAX_SECONDS = 1.5
+
+# Markdown patterns are compiled once at import instead of on every render
+_RE_CODEBLOCK = re.compile(r'```(\w+)?\n(.*?)```', re.DOTALL)
+_RE_INLINE_CODE = re.compile(r'`([^`]+)`')
+_RE_BOLD = re.compile(r'\*\*(.+?)\*\*')
+_RE_ITALIC = re.compile(r'\*(.+?)\*')
+_RE_LINK = re.compile(r'\[([^\]]+)\]\(([^)]+)\)')
+_RE_HEADER = re.compile(r'^(#{1,3}) (.+)$', re.MULTILINE)
+
+def _header_html(match: re.Match) -> str:
+    level = len(match.group(1))
+    return f"<h{level}>{match.group(2)}</h{level}>"
+
+# Single-pass markdown renderer; the regex pipeline below is the fallback
+_md = mistune.create_markdown(escape=False, plugins=['strikethrough', 'table']) if mistune else None
+
+def _render_markdown_uncached(text: str) -> str:
     """Basic markdown to HTML conversion for chat messages."""
-    # Code blocks
-    text = re.sub(r'```(\w+)?\n(.*?)```', r'<pre><code>\2</code></pre>', text, flags=re.DOTALL)
-    # Inline code
-    text = re.sub(r'`([^`]+)`', r'<code>\1</code>', text)
-    # Bold
-    text = re.sub(r'\*\*(.+?)\*\*', r'<strong>\1</strong>', text)
-    # Italic
-    text = re.sub(r'\*(.+?)\*', r'<em>\1</em>', text)
-    # Links
-    text = re.sub(r'\[([^\]]+)\]\(([^)]+)\)', r'<a href="\2" target="_blank">\1</a>', text)
-    # Headers
-    text = re.sub(r'^### (.+)$', r'<h3>\1</h3>', text, flags=re.MULTILINE)
-    text = re.sub(r'^## (.+)$', r'<h2>\1</h2>', text, flags=re.MULTILINE)
-    text = re.sub(r'^# (.+)$', r'<h1>\1</h1>', text, flags=re.MULTILINE)
+    if _md is not None:
+        return _md(text)
+    # Each pass runs only when its marker is present; plain prose skips the regex engine
+    if '`' in text:
+        # Code blocks
+        text = _RE_CODEBLOCK.sub(r'<pre><code>\2</code></pre>', text)
+        # Inline code
+        text = _RE_INLINE_CODE.sub(r'<code>\1</code>', text)
+    if '*' in text:
+        # Bold
+        text = _RE_BOLD.sub(r'<strong>\1</strong>', text)
+        # Italic
+        text = _RE_ITALIC.sub(r'<em>\1</em>', text)
+    if '](' in text:
+        # Links
+        text = _RE_LINK.sub(r'<a href="\2" target="_blank">\1</a>', text)
+    if '#' in text:
+        # Headers (h1-h3 in a single pass)
+        text = _RE_HEADER.sub(_header_html, text)
     # Paragraphs (wrap text in p tags for better styling)
     lines = text.split('\n')
     processed_lines = []
@@ -170,38 +228,69 @@ def render_markdown(text: str) -> str:
             processed_lines.append(line)
     return '\n'.join(processed_lines)
 
-def generate_conversation_title(messages: List[Dict[str, str]]) -> str:
+@st.cache_data(show_spinner=False, max_entries=2048)
+def render_markdown(text: str) -> str:
+    """Memoized markdown rendering keyed by content; it survives reruns and is shared across sessions."""
+    return _render_markdown_uncached(text)
+
+def generate_conversation_title(messages: List[Message]) -> str:
     """Generate a title for the conversation based on first few messages."""
     if not messages:
         return "New Conversation"
-    first_user_msg = next((m['content'] for m in messages if m['role'] == 'user'), "")
+    first_user_msg = next((m.content for m in messages if m.role == 'user'), "")
     if len(first_user_msg) > 50:
         return first_user_msg[:47] + "..."
     return first_user_msg or "New Conversation"
 
-def stream_text_effect(text: str, container, delay: float = 0.03):
-    """Simulate streaming text effect."""
-    if not st.session_state.model_settings.get("streaming", True):
-        container.markdown(render_markdown(text), unsafe_allow_html=True)
-        return
-    
-    placeholder = container.empty()
-    displayed_text = ""
-    
-    for char in text:
-        displayed_text += char
-        placeholder.markdown(render_markdown(displayed_text), unsafe_allow_html=True)
+def _hhmm() -> str:
+    """Current UTC time as HH:MM for message timestamps, without building a datetime"""
+    t = time.gmtime()
+    return f"{t.tm_hour:02d}:{t.tm_min:02d}"
+
+def _iter_text_chunks(text: str, delay: float):
+    """Yield text in STREAM_CHUNK_CHARS pieces, pacing the reveal at delay seconds per character."""
+    for start in range(0, len(text), STREAM_CHUNK_CHARS):
+        chunk = text[start:start + STREAM_CHUNK_CHARS]
+        yield chunk
         if delay > 0:
-            time.sleep(delay)
+            time.sleep(delay * len(chunk))
+
+def _reveal_delay(text: str, delay: float = 0.03) -> float:
+    """Per-character reveal delay, shortened so the whole reply shows within STREAM_MAX_SECONDS"""
+    return min(delay, STREAM_MAX_SECONDS / len(text)) if text else 0.0
+
+def _touch_conversation(conv_id: str, messages: Optional[List[Message]] = None):
+    """Mark a conversation most recently used (storing messages if given) and evict the oldest."""
+    conversations = st.session_state.conversations
+    titles = st.session_state.conversation_titles
+    if messages is not None:
+        # Stored histories keep only their text; the bubble HTML is rebuilt if the
+        # conversation is reopened and scrolled past the live window
+        for message in messages:
+            message.html = ""
+        conversations[conv_id] = messages
+    if conv_id in conversations:
+        conversations.move_to_end(conv_id)
+    if conv_id in titles:
+        titles.move_to_end(conv_id)
+    while len(conversations) > MAX_CONVERSATIONS:
+        evicted, _ = conversations.popitem(last=False)
+        titles.pop(evicted, None)
+    while len(titles) > MAX_CONVERSATIONS:
+        titles.popitem(last=False)
 
 def display_conversation_sidebar():
     """Display conversation history in sidebar."""
     st.sidebar.markdown("### 💬 Conversations")
     
-    # Current conversation
-    current_title = generate_conversation_title(st.session_state.messages)
-    if st.session_state.active_conversation:
-        st.session_state.conversation_titles[st.session_state.active_conversation] = current_title
+    # Current conversation: the title depends only on the first user message, so once
+    # one is set it never changes and the message scan can be skipped
+    active = st.session_state.active_conversation
+    if active:
+        titles = st.session_state.conversation_titles
+        if titles.get(active, "New Conversation") == "New Conversation":
+            titles[active] = generate_conversation_title(st.session_state.messages)
+        _touch_conversation(active)
     
     # List conversations
     conversations = list(st.session_state.conversation_titles.items())
@@ -211,15 +300,50 @@ def display_conversation_sidebar():
         
         if st.sidebar.button(title, key=f"conv_{conv_id}", help=f"Switch to: {title}"):
             if conv_id != st.session_state.active_conversation:
-                # Save current conversation
+                # Save current conversation (messages are append-only, so store by reference)
                 if st.session_state.active_conversation:
-                    st.session_state.conversations[st.session_state.active_conversation] = st.session_state.messages.copy()
+                    _touch_conversation(st.session_state.active_conversation, st.session_state.messages)
                 
                 # Load selected conversation
                 st.session_state.active_conversation = conv_id
-                st.session_state.messages = st.session_state.conversations.get(conv_id, [])
+                st.session_state.messages = st.session_state.conversations.setdefault(conv_id, [])
+                _touch_conversation(conv_id)
                 st.rerun()
 
+# role -> (CSS class, avatar label); anything that isn't the user renders as the assistant
+_ROLE_META = {"user": ("user", "You"), "assistant": ("assistant", "AI")}
+
+def _message_html(message: Message) -> str:
+    """Static HTML bubble for a message outside the live chat window."""
+    role_class, avatar = _ROLE_META.get(message.role, _ROLE_META["assistant"])
+    return "".join((
+        "<div class='msg ", role_class, "'><div class='avatar'>", avatar[0], "</div>",
+        "<div class='bubble'>", render_markdown(message.content),
+        "<div class='meta'>", avatar, " • ", message.ts, "</div></div></div>"
+    ))
+
+def render_messages(messages: List[Message]):
+    """Render the latest window of messages natively; older ones collapse into one HTML block."""
+    window = st.session_state.window_size
+    older, recent = messages[:-window], messages[-window:]
+    if older:
+        with st.expander(f"Show earlier ({len(older)})"):
+            # One element for the whole block; each bubble's HTML is rendered once and kept on the message
+            buf = []
+            append = buf.append
+            for m in older:
+                if not m.html:
+                    m.html = _message_html(m)
+                append(m.html)
+            st.markdown("\n".join(buf), unsafe_allow_html=True)
+    for message in recent:
+        role = message.role
+        avatar = _ROLE_META.get(role, _ROLE_META["assistant"])[1]
+        with st.chat_message(role):
+            st.markdown(message.content)
+            if message.ts:
+                st.caption(f"{avatar} • {message.ts}")
+
 def display_model_controls():
     """Display model settings in sidebar."""
     st.sidebar.markdown("### ⚙️ Model Settings")
@@ -287,13 +411,18 @@ def build_gap_followup(field: str) -> str:
     }
     return mapping.get(field, f"Can you provide more details about {field}?")
 
+@st.cache_data(show_spinner=False, max_entries=64)
+def _gap_chips_html(present: Tuple[str, ...], missing: Tuple[str, ...]) -> str:
+    """Coverage chip strip; only 2^len(REQUIRED_FIELDS) layouts exist, so it is built once per layout."""
+    return "".join(
+        [f"<span class='chip chip-ok'>{f}</span>" for f in present]
+        + [f"<span class='chip chip-missing'>{f}</span>" for f in missing]
+    )
+
 def display_info_gaps(latest_entities: Dict[str, Any]):
     gaps = compute_info_gaps(latest_entities)
     st.markdown("#### Coverage")
-    gap_html = "".join([f"<span class='chip chip-ok'>{f}</span>" for f in gaps['present']])
-    if gaps['missing']:
-        gap_html += "".join([f"<span class='chip chip-missing'>{f}</span>" for f in gaps['missing']])
-    st.markdown(gap_html, unsafe_allow_html=True)
+    st.markdown(_gap_chips_html(tuple(gaps['present']), tuple(gaps['missing'])), unsafe_allow_html=True)
     if gaps['missing']:
         st.markdown("#### Ask for Missing Details")
         cols = st.columns(2)
@@ -302,46 +431,84 @@ def display_info_gaps(latest_entities: Dict[str, Any]):
                 if st.button(field.title(), key=f"gap_btn_{field}"):
                     prompt = build_gap_followup(field)
                     st.session_state.last_gap_prompt = prompt
-                    st.session_state.messages.append({"role": "user", "content": prompt})
+                    st.session_state.messages.append(Message("user", prompt))
                     with st.spinner("Gathering details..."):
                         resp = process_user_message(st.session_state.agent, prompt)
-                    st.session_state.messages.append({"role": "assistant", "content": resp})
+                    st.session_state.messages.append(Message("assistant", resp))
                     st.rerun()
 
-def generate_conversation_summary(messages: List[Dict[str, str]]) -> Optional[str]:
+@st.cache_data(show_spinner=False, max_entries=64)
+def _summarize(convo_hash: str, _convo_text: str) -> str:
+    """Summarize a transcript; keyed on its content hash (the underscore arg is not hashed)."""
+    from services.llm_service import _FALLBACK_PREFIXES
+    prompt = (
+        "Summarize the recruiting conversation below into: 1) Roles 2) Key requirements 3) Open questions. "
+        "Keep it under 120 words.\n\nConversation:\n" + _convo_text
+    )
+    summary = get_llm_service().generate(prompt)
+    # Providers return canned text instead of raising; raise so st.cache_data doesn't keep it
+    if summary.startswith(_FALLBACK_PREFIXES):
+        raise RuntimeError(summary)
+    return summary
+
+def generate_conversation_summary(messages: List[Message]) -> Optional[str]:
     if not messages:
         return None
     try:
-        from services.llm_service import LLMService
-        llm = LLMService()
-        convo_text = "\n".join([f"{m['role']}: {m['content']}" for m in messages[-12:]])
-        prompt = (
-            "Summarize the recruiting conversation below into: 1) Roles 2) Key requirements 3) Open questions. "
-            "Keep it under 120 words.\n\nConversation:\n" + convo_text
-        )
-        result = llm.generate(prompt)
-        return result
+        convo_text = "\n".join([f"{m.role}: {m.content}" for m in messages[-12:]])
+        convo_hash = hashlib.blake2b(convo_text.encode(), digest_size=12).hexdigest()
+        return _summarize(convo_hash, convo_text)
     except Exception as e:
         return f"Summary error: {e}";
 
-def export_conversation(format_: str) -> bytes:
+@st.cache_data(show_spinner=False, max_entries=32)
+def _export_cached(format_: str, messages: tuple, extractions: tuple) -> bytes:
+    """Serialize a conversation; unchanged conversations reuse the previous payload."""
     data = {
-        "messages": st.session_state.messages,
-        "extractions": st.session_state.extraction_results,
+        "messages": list(messages),
+        "extractions": list(extractions),
         "generated": datetime.utcnow().isoformat() + "Z"
     }
     if format_ == "json":
+        if orjson is not None:
+            # orjson writes bytes directly and handles datetimes natively
+            return orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
         return json.dumps(data, default=str, indent=2).encode()
     # CSV simple flatten
-    rows = []
-    for m in st.session_state.messages:
-        rows.append({"role": m.get("role"), "content": m.get("content")})
-    import csv
-    output = StringIO()
-    writer = csv.DictWriter(output, fieldnames=["role", "content"])
-    writer.writeheader()
-    writer.writerows(rows)
-    return output.getvalue().encode()
+    return pd.DataFrame(list(messages), columns=["role", "content"]).to_csv(index=False).encode()
+
+def export_conversation(format_: str) -> bytes:
+    return _export_cached(
+        format_,
+        # Plain dicts for the payload; the cached bubble HTML is left out
+        tuple({"role": m.role, "content": m.content, "ts": m.ts} for m in st.session_state.messages),
+        tuple(st.session_state.extraction_results)
+    )
+
+@st.cache_resource(show_spinner=False)
+def get_agent():
+    """Build the AI Sales Agent once per server process"""
+    from main import EnhancedAISalesAgent
+    return EnhancedAISalesAgent()
+
+@st.cache_resource(show_spinner=False)
+def get_llm_service():
+    """Shared LLM client for summaries and entity extraction"""
+    from services.llm_service import LLMService
+    return LLMService()
+
+@st.cache_resource(show_spinner=False)
+def get_ner_service():
+    """Shared advanced NER service built on the cached LLM client"""
+    from services.advanced_ner import create_advanced_ner_service
+    return create_advanced_ner_service(get_llm_service())
+
+def get_executor() -> ThreadPoolExecutor:
+    """Per-session worker for entity extraction; a shared pool would cap turns across all users"""
+    if "executor" not in st.session_state:
+        # The idle worker exits once the session (and with it the executor) is discarded
+        st.session_state.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sales-agent-ner")
+    return st.session_state.executor
 
 def initialize_agent():
     """Initialize the AI Sales Agent"""
@@ -353,12 +520,9 @@ def initialize_agent():
         if '/Users/vidhusinha/Desktop/Project' not in sys.path:
             sys.path.append('/Users/vidhusinha/Desktop/Project')
         
-        from main import EnhancedAISalesAgent
-        from services.llm_service import LLMService
-        
-        # Initialize agent
-        agent = EnhancedAISalesAgent()
-        llm_service = LLMService()
+        # Cached resources: failures raise and are retried on the next run
+        agent = get_agent()
+        llm_service = get_llm_service()
         
         # Get system status
         status = agent.get_system_status()
@@ -421,6 +585,32 @@ def display_system_status(status):
         </div>
         """.format(version), unsafe_allow_html=True)
 
+@st.cache_data(show_spinner=False, max_entries=64)
+def _build_confidence_gauge(confidence: float) -> go.Figure:
+    """Confidence gauge figure; rebuilt only when the confidence value changes"""
+    fig = go.Figure(go.Indicator(
+        mode="gauge+number",
+        value=confidence * 100,
+        domain={'x': [0, 1], 'y': [0, 1]},
+        title={'text': "Confidence"},
+        gauge={
+            'axis': {'range': [None, 100]},
+            'bar': {'color': "#667eea"},
+            'steps': [
+                {'range': [0, 50], 'color': "#f8d7da"},
+                {'range': [50, 80], 'color': "#fff3cd"},
+                {'range': [80, 100], 'color': "#d4edda"}
+            ],
+            'threshold': {
+                'line': {'color': "red", 'width': 4},
+                'thickness': 0.75,
+                'value': 90
+            }
+        }
+    ))
+    fig.update_layout(height=250)
+    return fig
+
 def display_extraction_results(results):
     """Display entity extraction results"""
     if not results:
@@ -456,110 +646,194 @@ def display_extraction_results(results):
         st.write(f"**Confidence:** {confidence:.1%}")
 
         # Simple accuracy visualization
-        fig = go.Figure(go.Indicator(
-            mode="gauge+number",
-            value=confidence * 100,
-            domain={'x': [0, 1], 'y': [0, 1]},
-            title={'text': "Confidence"},
-            gauge={
-                'axis': {'range': [None, 100]},
-                'bar': {'color': "#667eea"},
-                'steps': [
-                    {'range': [0, 50], 'color': "#f8d7da"},
-                    {'range': [50, 80], 'color': "#fff3cd"},
-                    {'range': [80, 100], 'color': "#d4edda"}
-                ],
-                'threshold': {
-                    'line': {'color': "red", 'width': 4},
-                    'thickness': 0.75,
-                    'value': 90
-                }
-            }
-        ))
-        fig.update_layout(height=250)
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(_build_confidence_gauge(confidence), use_container_width=True)
 
         st.markdown("</div>", unsafe_allow_html=True)
 
-def display_performance_charts():
-    """Display performance analytics"""
-    st.markdown("### 📈 Performance Analytics")
-    
-    # Sample performance data (in real app, this would come from the agent)
-    performance_data = pd.DataFrame({
+@st.cache_resource(show_spinner=False)
+def _perf_data() -> pd.DataFrame:
+    """Sample performance data (in real app, this would come from the agent)"""
+    # Built here rather than at module scope: this script re-executes on every rerun
+    return pd.DataFrame({
         'Date': pd.date_range('2025-08-01', periods=10, freq='D'),
         'Conversations': [5, 8, 12, 15, 18, 22, 25, 28, 30, 35],
         'Extraction_Accuracy': [85, 87, 90, 92, 95, 97, 98, 99, 100, 100],
         'Response_Quality': [75, 78, 82, 85, 88, 90, 92, 94, 96, 98]
     })
+
+@st.cache_resource(show_spinner=False)
+def _perf_fig_conversations() -> go.Figure:
+    fig = px.line(_perf_data(), x='Date', y='Conversations', 
+                  title='Daily Conversations',
+                  color_discrete_sequence=['#667eea'])
+    fig.update_layout(
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+    )
+    return fig
+
+@st.cache_resource(show_spinner=False)
+def _perf_fig_quality() -> go.Figure:
+    fig = px.line(_perf_data(), x='Date', y=['Extraction_Accuracy', 'Response_Quality'], 
+                  title='Quality Metrics Over Time',
+                  color_discrete_sequence=['#667eea', '#764ba2'])
+    fig.update_layout(
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+    )
+    return fig
+
+def display_performance_charts():
+    """Display performance analytics"""
+    st.markdown("### 📈 Performance Analytics")
     
     col1, col2 = st.columns(2)
     
     with col1:
-        fig1 = px.line(performance_data, x='Date', y='Conversations', 
-                      title='Daily Conversations',
-                      color_discrete_sequence=['#667eea'])
-        fig1.update_layout(
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)',
-        )
-        st.plotly_chart(fig1, use_container_width=True)
+        st.plotly_chart(_perf_fig_conversations(), use_container_width=True)
     
     with col2:
-        fig2 = px.line(performance_data, x='Date', y=['Extraction_Accuracy', 'Response_Quality'], 
-                      title='Quality Metrics Over Time',
-                      color_discrete_sequence=['#667eea', '#764ba2'])
-        fig2.update_layout(
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)',
-        )
-        st.plotly_chart(fig2, use_container_width=True)
+        st.plotly_chart(_perf_fig_quality(), use_container_width=True)
+
+class _DegradedExtraction(Exception):
+    """Carries a rule-based/fallback extraction out of the cached function so it isn't stored"""
+
+    def __init__(self, data: Dict[str, Any]):
+        super().__init__(data['method'])
+        self.data = data
+
+@st.cache_data(show_spinner=False, max_entries=256)
+def _extract_entities_cached(message: str) -> Dict[str, Any]:
+    """Extract entities for a message; identical messages reuse the cached LLM result"""
+    extraction_result = get_ner_service().extract_entities(message)
+    
+    # Calculate confidence
+    if extraction_result.confidence_scores:
+        avg_confidence = sum(extraction_result.confidence_scores.values()) / len(extraction_result.confidence_scores)
+    else:
+        avg_confidence = 0.8  # Default
+    
+    data = {
+        'entities': extraction_result.entities,
+        'method': extraction_result.extraction_method,
+        'confidence': avg_confidence
+    }
+    # The NER service falls back instead of raising when the LLM call fails; a transient
+    # error must not pin the degraded result for this message across sessions
+    if data['method'] != 'llm':
+        raise _DegradedExtraction(data)
+    return data
+
+def _extract_entities(message: str) -> Dict[str, Any]:
+    """Entities for a message, cached only when the LLM extraction succeeded"""
+    try:
+        return _extract_entities_cached(message)
+    except _DegradedExtraction as degraded:
+        return degraded.data
 
 def process_user_message(agent, message):
     """Process user message and get AI response"""
     try:
-        if not st.session_state.session_id:
+        # Entities are extracted on this session's worker while the agent call runs on
+        # the script thread, so the turn takes max(agent, NER) rather than their sum
+        ner_future = get_executor().submit(_extract_entities, message)
+        
+        session_id = st.session_state.session_id
+        if not session_id:
             # Start new conversation
             result = agent.start_conversation(message)
-            st.session_state.session_id = result.get('session_id')
-            response = result.get('response', 'Hello! How can I help you with your hiring needs?')
         else:
             # Continue conversation
-            result = agent.process_message(st.session_state.session_id, message)
-            response = result.get('response', 'I understand. Could you tell me more?')
+            result = agent.process_message(session_id, message)
         
         # Extract entities for display
         try:
-            from services.advanced_ner import create_advanced_ner_service
-            from services.llm_service import LLMService
-            
-            llm_service = LLMService()
-            ner_service = create_advanced_ner_service(llm_service)
-            extraction_result = ner_service.extract_entities(message)
-            
-            # Calculate confidence
-            if extraction_result.confidence_scores:
-                avg_confidence = sum(extraction_result.confidence_scores.values()) / len(extraction_result.confidence_scores)
-            else:
-                avg_confidence = 0.8  # Default
-            
-            extraction_data = {
-                'entities': extraction_result.entities,
-                'method': extraction_result.extraction_method,
-                'confidence': avg_confidence,
-                'timestamp': datetime.now()
-            }
+            # Copy so the timestamp never leaks into the cached value
+            extraction_data = dict(ner_future.result())
+            extraction_data['timestamp'] = datetime.now()
             
             st.session_state.extraction_results.append(extraction_data)
             
         except Exception as e:
-            st.sidebar.error(f"Extraction error: {str(e)}")
+            # Toast rather than sidebar: this also runs inside the chat fragment
+            st.toast(f"Extraction error: {str(e)}")
+        
+        if not session_id:
+            st.session_state.session_id = result.get('session_id')
+            response = result.get('response', 'Hello! How can I help you with your hiring needs?')
+        else:
+            response = result.get('response', 'I understand. Could you tell me more?')
         
         return response
         
     except Exception as e:
         return f"I apologize, but I encountered an error: {str(e)}. Could you please try again?"
 
+def process_user_message_stream(agent, message) -> Iterator[str]:
+    """Yield the assistant reply in chunks for st.write_stream"""
+    # The agent routes each turn through several sub-agents and returns a finished
+    # reply, so chunks start as soon as that reply lands
+    response = process_user_message(agent, message)
+    if not st.session_state.model_settings.get("streaming", True):
+        yield response
+        return
+    yield from _iter_text_chunks(response, _reveal_delay(response))
+
+def _queue_quick_prompt():
+    """Hand the chosen quick prompt to main() and clear the box so it doesn't fire again"""
+    st.session_state.pending_prompt = st.session_state.quick_prompt
+    st.session_state.quick_prompt = None
+
+@st.fragment
+def chat_panel():
+    """Chat history, typing indicator and input; reruns on its own so the tabs and sidebar stay mounted"""
+    # Chat area
+    st.markdown("<div class='chat-wrapper'>", unsafe_allow_html=True)
+    chat_scroll = st.container()
+    
+    with chat_scroll:
+        st.markdown("<div class='chat-scroll'>", unsafe_allow_html=True)
+        
+        # Display messages
+        render_messages(st.session_state.messages)
+        
+        st.markdown("</div>", unsafe_allow_html=True)
+
+    # Input bar
+    st.markdown("<div class='input-bar'>", unsafe_allow_html=True)
+    
+    # Input with enhanced placeholder
+    placeholder_text = "Message the recruiting assistant… (supports markdown)"
+    user_input = st.chat_input(placeholder_text)
+    
+    if user_input:
+        # Add user message
+        st.session_state.messages.append(
+            Message("user", user_input, _hhmm())
+        )
+        
+        # Stream the reply into the assistant bubble; the typing indicator sits in the
+        # same placeholder and is replaced by the first chunk
+        with chat_scroll:
+            with st.chat_message("user"):
+                st.markdown(user_input)
+            with st.chat_message("assistant"):
+                placeholder = st.empty()
+                if st.session_state.model_settings.get("show_typing", True):
+                    placeholder.markdown("<span class='typing-dots'>AI is thinking</span>", unsafe_allow_html=True)
+                response = placeholder.write_stream(
+                    process_user_message_stream(st.session_state.agent, user_input)
+                )
+        
+        # Add AI response; both bubbles are already drawn above, so no rerun is needed
+        # (and scope="fragment" would raise if this ran as part of a full-app rerun)
+        st.session_state.messages.append(
+            Message("assistant", response, _hhmm())
+        )
+        
+    st.markdown("</div>", unsafe_allow_html=True)
+    st.markdown("</div>", unsafe_allow_html=True)
+
 def main():
     """Main application"""
     display_header()
@@ -579,7 +853,8 @@ def main():
     # Sidebar with system info & controls
     with st.sidebar:
         # Theme toggle
-        st.toggle("🌙 Dark Mode", key="dark_mode", on_change=lambda: inject_css(st.session_state.dark_mode))
+        # The module-level inject_css call picks up the new theme on the rerun
+        st.toggle("🌙 Dark Mode", key="dark_mode")
         
         # Conversation history
         display_conversation_sidebar()
@@ -607,26 +882,26 @@ def main():
             content = uploaded.read().decode("utf-8", errors="ignore")
             st.session_state.uploaded_job_spec = content
             if st.button("Extract From Spec"):
-                st.session_state.messages.append({"role": "user", "content": content[:1500]})
+                st.session_state.messages.append(Message("user", content[:1500]))
                 with st.spinner("Analyzing spec..."):
                     resp = process_user_message(st.session_state.agent, content[:1500])
-                st.session_state.messages.append({"role": "assistant", "content": resp})
+                st.session_state.messages.append(Message("assistant", resp))
                 st.rerun()
         st.markdown("---")
         
         if st.button("🧹 New Conversation"):
             # Save current conversation
             if st.session_state.messages:
-                conv_id = str(uuid.uuid4())[:8]
-                st.session_state.conversations[conv_id] = st.session_state.messages.copy()
+                conv_id = secrets.token_hex(4)
                 st.session_state.conversation_titles[conv_id] = generate_conversation_title(st.session_state.messages)
+                _touch_conversation(conv_id, st.session_state.messages)
             
             # Reset state
             st.session_state.messages = []
             st.session_state.session_id = None
             st.session_state.extraction_results = []
             st.session_state.summary = None
-            st.session_state.active_conversation = str(uuid.uuid4())[:8]
+            st.session_state.active_conversation = secrets.token_hex(4)
             st.rerun()
             
         st.markdown("## 🧪 Test Scenarios")
@@ -637,10 +912,10 @@ def main():
         ]
         for i, scenario in enumerate(test_scenarios, 1):
             if st.button(f"Scenario {i}", key=f"test_{i}"):
-                st.session_state.messages.append({"role": "user", "content": scenario})
+                st.session_state.messages.append(Message("user", scenario))
                 with st.spinner("Processing scenario..."):
                     response = process_user_message(st.session_state.agent, scenario)
-                st.session_state.messages.append({"role": "assistant", "content": response})
+                st.session_state.messages.append(Message("assistant", response))
                 st.rerun()
         st.markdown("---")
         
@@ -653,10 +928,14 @@ def main():
             with coly:
                 st.download_button("CSV", data=export_conversation("csv"), file_name="conversation.csv", mime="text/csv")
 
-    # Tabs structure
-    tabs = st.tabs(["💬 Chat", "🧠 Entities", "📈 Analytics"])
+    # Section switcher: st.tabs executes every tab body on each rerun, so only the
+    # selected section is built here
+    active_tab = st.radio(
+        "Section", ["💬 Chat", "🧠 Entities", "📈 Analytics"],
+        key="active_tab", horizontal=True, label_visibility="collapsed"
+    )
 
-    with tabs[0]:
+    if active_tab == "💬 Chat":
         # Conversation management row
         top_cols = st.columns([6,2,2])
         with top_cols[0]:
@@ -669,118 +948,42 @@ def main():
             if st.button("➕ New Chat", use_container_width=True):
                 # Save current conversation
                 if st.session_state.messages:
-                    conv_id = str(uuid.uuid4())[:8]
-                    st.session_state.conversations[conv_id] = st.session_state.messages.copy()
+                    conv_id = secrets.token_hex(4)
                     st.session_state.conversation_titles[conv_id] = generate_conversation_title(st.session_state.messages)
+                    _touch_conversation(conv_id, st.session_state.messages)
                 
                 # Reset
                 st.session_state.messages = []
                 st.session_state.session_id = None
-                st.session_state.active_conversation = str(uuid.uuid4())[:8]
-                st.session_state.conversations[st.session_state.active_conversation] = []
+                st.session_state.active_conversation = secrets.token_hex(4)
+                _touch_conversation(st.session_state.active_conversation, st.session_state.messages)
                 st.rerun()
 
         # Quick prompts chips
         st.markdown("<div class='toolbar-chips'>", unsafe_allow_html=True)
-        chip_cols = st.columns(3)
-        for i, prompt in enumerate(st.session_state.quick_prompts):
-            with chip_cols[i % 3]:
-                if st.button(f"💡 {prompt[:25]}...", key=f"quick_{i}", help=prompt, use_container_width=True):
-                    st.session_state.messages.append({"role": "user", "content": prompt, "ts": datetime.utcnow().strftime("%H:%M")})
-                    with st.spinner("🤖 Generating response..."):
-                        response = process_user_message(st.session_state.agent, prompt)
-                    st.session_state.messages.append({"role": "assistant", "content": response, "ts": datetime.utcnow().strftime("%H:%M")})
-                    st.rerun()
-        st.markdown("</div>", unsafe_allow_html=True)
-
-        # Chat area
-        st.markdown("<div class='chat-wrapper'>", unsafe_allow_html=True)
-        chat_scroll = st.container()
-        
-        with chat_scroll:
-            st.markdown("<div class='chat-scroll'>", unsafe_allow_html=True)
-            
-            # Display messages
-            for idx, message in enumerate(st.session_state.messages):
-                role = message.get("role")
-                content = message.get("content")
-                avatar = "You" if role == "user" else "AI"
-                role_class = "user" if role == "user" else "assistant"
-                timestamp = message.get("ts") or datetime.utcnow().strftime("%H:%M")
-                
-                # Enhanced message rendering with markdown
-                rendered_content = render_markdown(content)
-                
-                html = f"""
-                <div class='msg {role_class}'>
-                    <div class='avatar'>{avatar[0]}</div>
-                    <div class='bubble'>
-                        {rendered_content}
-                        <div class='meta'>{avatar} • {timestamp}</div>
-                    </div>
-                </div>
-                """
-                st.markdown(html, unsafe_allow_html=True)
-            
-            # Typing indicator
-            if st.session_state.is_typing and st.session_state.model_settings.get("show_typing", True):
-                st.markdown("""
-                <div class='msg assistant'>
-                    <div class='avatar'>AI</div>
-                    <div class='bubble'>
-                        <div class='typing-indicator'>
-                            <span class='typing-dots'>AI is thinking</span>
-                        </div>
-                    </div>
-                </div>
-                """, unsafe_allow_html=True)
-            
-            st.markdown("</div>", unsafe_allow_html=True)
-
-        # Input bar
-        st.markdown("<div class='input-bar'>", unsafe_allow_html=True)
-        
-        # Input with enhanced placeholder
-        placeholder_text = "Message the recruiting assistant… (supports markdown)"
-        user_input = st.chat_input(placeholder_text)
-        
-        if user_input:
-            # Add user message
-            st.session_state.messages.append({
-                "role": "user", 
-                "content": user_input, 
-                "ts": datetime.utcnow().strftime("%H:%M")
-            })
-            
-            # Show typing indicator
-            if st.session_state.model_settings.get("show_typing", True):
-                st.session_state.is_typing = True
-                st.rerun()
-            
-            # Get AI response with streaming effect
+        # One selectbox instead of a button per prompt
+        st.selectbox(
+            "Quick prompts", st.session_state.quick_prompts, index=None, key="quick_prompt",
+            placeholder="💡 Try a quick prompt…", label_visibility="collapsed",
+            on_change=_queue_quick_prompt
+        )
+        prompt = st.session_state.pop("pending_prompt", None)
+        if prompt:
+            # Handled before chat_panel() draws, so the reply shows without another rerun
+            st.session_state.messages.append(Message("user", prompt, _hhmm()))
             with st.spinner("🤖 Generating response..."):
-                response = process_user_message(st.session_state.agent, user_input)
-            
-            # Hide typing indicator
-            st.session_state.is_typing = False
-            
-            # Add AI response
-            st.session_state.messages.append({
-                "role": "assistant", 
-                "content": response, 
-                "ts": datetime.utcnow().strftime("%H:%M")
-            })
-            st.rerun()
-            
-        st.markdown("</div>", unsafe_allow_html=True)
+                response = process_user_message(st.session_state.agent, prompt)
+            st.session_state.messages.append(Message("assistant", response, _hhmm()))
         st.markdown("</div>", unsafe_allow_html=True)
 
+        chat_panel()
+
         # Summary box
         if st.session_state.summary:
             st.markdown("<div class='summary-box'><strong>💡 Summary:</strong><br>" + render_markdown(st.session_state.summary) + "</div>", unsafe_allow_html=True)
 
     # Entities tab
-    with tabs[1]:
+    elif active_tab == "🧠 Entities":
         st.markdown("### Extracted Entities & Coverage")
         if st.session_state.extraction_results:
             display_extraction_results(st.session_state.extraction_results)
@@ -790,7 +993,7 @@ def main():
             st.caption("No entities extracted yet. Start chatting or upload a job spec.")
 
     # Analytics tab
-    with tabs[2]:
+    else:
         st.markdown("### Performance & Metrics")
         if st.session_state.messages:
             display_performance_charts()
@@ -3,6 +3,9 @@ Fine-tuned Prompts for AI Sales Agent - Groq Optimization
 Specialized prompts for recruiting scenarios with Groq LLM provider
 """
 
+import string
+from typing import Dict, Optional, Tuple
+
 # Entity Extraction Prompt for NER
 ENTITY_EXTRACTION_PROMPT = """You are an expert at extracting hiring information from client messages.
 
@@ -135,3 +138,34 @@ Provide insights on:
 4. Recommended recruitment strategy
 
 Format as brief bullet points for internal use."""
+
+
+# Templates by name, split once into (literal, field) segments so rendering is a plain join
+_TEMPLATES: Dict[str, str] = {
+    "entity_extraction": ENTITY_EXTRACTION_PROMPT,
+    "greeting": GREETING_PROMPT,
+    "recommendation": RECOMMENDATION_PROMPT,
+    "proposal": PROPOSAL_PROMPT,
+    "followup": FOLLOWUP_PROMPT,
+    "skills_extraction": SKILLS_EXTRACTION_PROMPT,
+    "company_analysis": COMPANY_ANALYSIS_PROMPT,
+}
+
+
+def _compile(template: str) -> Tuple[Tuple[str, Optional[str]], ...]:
+    """Parse a str.format template into segments; only plain {field} placeholders are used here"""
+    return tuple((literal, field) for literal, field, _spec, _conv in string.Formatter().parse(template))
+
+
+_COMPILED = {name: _compile(template) for name, template in _TEMPLATES.items()}
+
+
+def render_prompt(name: str, **kwargs) -> str:
+    """Fill a named prompt template; same output as TEMPLATE.format(**kwargs) without re-parsing"""
+    buf = []
+    append = buf.append
+    for literal, field in _COMPILED[name]:
+        append(literal)
+        if field is not None:
+            append(str(kwargs[field]))
+    return "".join(buf)
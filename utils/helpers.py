@@ -3,87 +3,149 @@ Utility functions for the AI Sales Agent
 """
 import re
 import json
+import atexit
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
+from functools import lru_cache
 import uuid
 
+# Patterns are compiled once at import; the helpers below run on every message
+_NUM_RE = re.compile(r'\d+')
+_NON_DIGIT_RE = re.compile(r'\D')
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+# Emails and phone numbers in one pass; the named group tells which one matched
+_CONTACT_RE = re.compile(
+    r'(?P<email>\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b)'
+    r'|(?P<phone>'
+    r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b'  # US format
+    r'|\b\(\d{3}\)\s*\d{3}[-.]?\d{4}\b'  # (123) 456-7890
+    r'|\b\+\d{1,3}[-.\s]?\d{10,14}\b'  # International
+    r')'
+)
+_JSON_FENCE_OPEN_RE = re.compile(r'^```json\s*', re.MULTILINE)
+_JSON_FENCE_CLOSE_RE = re.compile(r'\s*```$', re.MULTILINE)
+_NEWLINES_RE = re.compile(r'\n{3,}')
+
+try:
+    import orjson  # Optional: faster parsing of LLM JSON payloads
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover - optional dependency
+    _json_loads = json.loads
+
+# Background listener that owns the real log handlers (see setup_logging)
+_log_listener: Optional[QueueListener] = None
+
 
 def setup_logging(log_level: str = "INFO") -> logging.Logger:
     """Setup logging configuration"""
-    logging.basicConfig(
-        level=getattr(logging, log_level.upper()),
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler('sales_agent.log'),
-            logging.StreamHandler()
-        ]
-    )
+    global _log_listener
+    if _log_listener is None:
+        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+        file_handler = RotatingFileHandler('sales_agent.log', maxBytes=5 * 1024 * 1024, backupCount=3)
+        stream_handler = logging.StreamHandler()
+        file_handler.setFormatter(formatter)
+        stream_handler.setFormatter(formatter)
+        
+        # Callers only enqueue records; formatting and I/O run on the listener thread
+        log_queue = queue.Queue(-1)
+        queue_handler = QueueHandler(log_queue)
+        queue_handler.setFormatter(logging.Formatter('%(message)s'))
+        _log_listener = QueueListener(log_queue, file_handler, stream_handler, respect_handler_level=True)
+        _log_listener.start()
+        atexit.register(_log_listener.stop)
+        
+        logging.basicConfig(
+            level=getattr(logging, log_level.upper()),
+            handlers=[queue_handler]
+        )
     return logging.getLogger(__name__)
 
 
 def generate_session_id() -> str:
     """Generate a unique session ID"""
-    return str(uuid.uuid4())
+    # 32-char hex form; skips formatting the dashed UUID string
+    return uuid.uuid4().hex
 
 
+@lru_cache(maxsize=4096)
 def normalize_text(text: str) -> str:
     """Normalize text for better matching"""
     if not text:
         return ""
-    # Convert to lowercase and remove extra spaces
-    text = re.sub(r'\s+', ' ', text.lower().strip())
-    return text
+    # Lowercase and collapse whitespace runs; split() also drops leading/trailing space
+    return " ".join(text.lower().split())
 
 
 def extract_numbers_from_text(text: str) -> List[int]:
     """Extract numbers from text"""
-    numbers = re.findall(r'\d+', text)
+    numbers = _NUM_RE.findall(text)
     return [int(num) for num in numbers]
 
 
+@lru_cache(maxsize=512)
+def _role_count_patterns(role_lower: str) -> Tuple[re.Pattern, ...]:
+    """Count patterns for one role, compiled once, in priority order"""
+    role = re.escape(role_lower)
+    return (
+        re.compile(rf'(\d+)\s+{role}'),  # "2 backend engineers"
+        re.compile(rf'{role}.*?(\d+)'),  # "designer x 3"
+        re.compile(rf'(\d+).*?{role}')  # "5 senior backend engineers"
+    )
+
+
 def find_role_counts(text: str, roles: List[str]) -> Dict[str, int]:
     """Find role counts from text"""
+    if not roles:
+        return {}
+    # Copy so callers can't mutate the memoized result
+    return dict(_role_counts(text, tuple(roles)))
+
+
+@lru_cache(maxsize=512)
+def _role_counts(text: str, roles: Tuple[str, ...]) -> Dict[str, int]:
+    """Role counts for one (text, roles) pair; the same turn is often scanned by several extractors"""
     role_counts = {}
     text_lower = text.lower()
     
     for role in roles:
         role_lower = role.lower()
-        # Look for patterns like "2 backend engineers", "3 designers", etc.
-        patterns = [
-            rf'(\d+)\s+{re.escape(role_lower)}',
-            rf'{re.escape(role_lower)}.*?(\d+)',
-            rf'(\d+).*?{re.escape(role_lower)}'
-        ]
-        
-        for pattern in patterns:
-            matches = re.findall(pattern, text_lower)
-            if matches:
-                # Take the first number found
-                try:
-                    role_counts[role] = int(matches[0])
-                    break
-                except (ValueError, IndexError):
-                    continue
+        # Every pattern needs the role verbatim, so absent roles skip the regex work
+        if role_lower not in text_lower:
+            continue
+        for pattern in _role_count_patterns(role_lower):
+            # The first match in the text wins, as findall()[0] did
+            match = pattern.search(text_lower)
+            if match:
+                role_counts[role] = int(match.group(1))
+                break
     
     return role_counts
 
 
+@lru_cache(maxsize=4096)
+def _word_set(text: str) -> frozenset:
+    """Normalized word set; package names are compared against every inquiry, so reuse it"""
+    return frozenset(normalize_text(text).split())
+
+
 def calculate_similarity(text1: str, text2: str) -> float:
     """Simple similarity calculation based on common words"""
     if not text1 or not text2:
         return 0.0
     
-    words1 = set(normalize_text(text1).split())
-    words2 = set(normalize_text(text2).split())
+    words1 = _word_set(text1)
+    words2 = _word_set(text2)
     
     if not words1 or not words2:
         return 0.0
     
-    intersection = words1.intersection(words2)
-    union = words1.union(words2)
+    intersection = len(words1 & words2)
+    union = len(words1) + len(words2) - intersection
     
-    return len(intersection) / len(union) if union else 0.0
+    return intersection / union if union else 0.0
 
 
 def format_currency(amount: str) -> str:
@@ -97,8 +159,7 @@ def validate_email(email: str) -> bool:
     """Validate email format"""
     if not email:
         return False
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return bool(re.match(pattern, email))
+    return bool(_EMAIL_RE.match(email))
 
 
 def validate_phone(phone: str) -> bool:
@@ -106,7 +167,7 @@ def validate_phone(phone: str) -> bool:
     if not phone:
         return False
     # Remove all non-digit characters
-    digits = re.sub(r'\D', '', phone)
+    digits = _NON_DIGIT_RE.sub('', phone)
     # Check if it's a valid length (10-15 digits)
     return 10 <= len(digits) <= 15
 
@@ -115,23 +176,15 @@ def extract_contact_info(text: str) -> Dict[str, str]:
     """Extract contact information from text"""
     contact_info = {}
     
-    # Email extraction
-    email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-    emails = re.findall(email_pattern, text)
-    if emails:
-        contact_info['email'] = emails[0]
-    
-    # Phone extraction
-    phone_patterns = [
-        r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b',  # US format
-        r'\b\(\d{3}\)\s*\d{3}[-.]?\d{4}\b',  # (123) 456-7890
-        r'\b\+\d{1,3}[-.\s]?\d{10,14}\b'  # International
-    ]
-    
-    for pattern in phone_patterns:
-        phones = re.findall(pattern, text)
-        if phones:
-            contact_info['phone'] = phones[0]
+    # First email and first valid phone number win; stop scanning once both are found
+    for match in _CONTACT_RE.finditer(text):
+        kind = match.lastgroup
+        if kind in contact_info:
+            continue
+        if kind == 'phone' and not validate_phone(match.group()):
+            continue
+        contact_info[kind] = match.group()
+        if len(contact_info) == 2:
             break
     
     return contact_info
@@ -139,25 +192,25 @@ def extract_contact_info(text: str) -> Dict[str, str]:
 
 def format_list_for_display(items: List[str], max_items: int = 5) -> str:
     """Format a list for display with proper grammar"""
-    if not items:
+    count = len(items)
+    if not count:
         return "None specified"
     
-    if len(items) > max_items:
-        displayed_items = items[:max_items]
-        return f"{', '.join(displayed_items[:-1])}, {displayed_items[-1]}, and {len(items) - max_items} others"
-    elif len(items) == 1:
+    if count > max_items:
+        # One slice for the shown items; the remainder is only counted
+        return f"{', '.join(items[:max_items])}, and {count - max_items} others"
+    if count == 1:
         return items[0]
-    elif len(items) == 2:
+    if count == 2:
         return f"{items[0]} and {items[1]}"
-    else:
-        return f"{', '.join(items[:-1])}, and {items[-1]}"
+    return f"{', '.join(items[:-1])}, and {items[-1]}"
 
 
 def safe_json_loads(json_str: str) -> Optional[Dict[str, Any]]:
     """Safely load JSON string"""
     try:
-        return json.loads(json_str)
-    except (json.JSONDecodeError, TypeError):
+        return _json_loads(json_str)
+    except (ValueError, TypeError):  # orjson.JSONDecodeError subclasses ValueError
         return None
 
 
@@ -172,10 +225,11 @@ def clean_llm_response(response: str) -> str:
         return ""
     
     # Remove potential JSON formatting
-    response = re.sub(r'^```json\s*', '', response, flags=re.MULTILINE)
-    response = re.sub(r'\s*```$', '', response, flags=re.MULTILINE)
+    if '```' in response:
+        response = _JSON_FENCE_OPEN_RE.sub('', response)
+        response = _JSON_FENCE_CLOSE_RE.sub('', response)
     
     # Remove excessive newlines
-    response = re.sub(r'\n{3,}', '\n\n', response)
+    response = _NEWLINES_RE.sub('\n\n', response)
     
     return response.strip()
@@ -0,0 +1,80 @@
+"""
+Exact-match response cache for LLM calls
+"""
+import hashlib
+import logging
+import sqlite3
+import time
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+class LLMResponseCache:
+    """SQLite-backed prompt -> response cache with a time-to-live and a row cap"""
+
+    def __init__(self, db_path: str = ".llm_cache.db", ttl_seconds: int = 86400, max_entries: int = 5000):
+        self.db_path = Path(db_path)
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._init_database()
+
+    def _init_database(self):
+        """Create the cache table if needed"""
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS llm_cache (
+                    key TEXT PRIMARY KEY,
+                    response TEXT NOT NULL,
+                    expires_at REAL NOT NULL
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_llm_cache_expires ON llm_cache (expires_at)")
+            self._prune(conn)
+
+    def _prune(self, conn: sqlite3.Connection):
+        """Delete expired rows, then the soonest-to-expire ones beyond max_entries"""
+        conn.execute("DELETE FROM llm_cache WHERE expires_at < ?", (time.time(),))
+        (count,) = conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()
+        if count > self.max_entries:
+            conn.execute(
+                "DELETE FROM llm_cache WHERE key IN "
+                "(SELECT key FROM llm_cache ORDER BY expires_at LIMIT ?)",
+                (count - self.max_entries,)
+            )
+
+    @staticmethod
+    def make_key(*parts: str) -> str:
+        """Hash the parts that determine a response (provider, model, system prompt, prompt)"""
+        digest = hashlib.sha256()
+        for part in parts:
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response, or None when missing or expired"""
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                row = conn.execute(
+                    "SELECT response, expires_at FROM llm_cache WHERE key = ?", (key,)
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning("LLM cache read failed: %s", e)
+            return None
+        if row is None or row[1] < time.time():
+            return None
+        return row[0]
+
+    def set(self, key: str, response: str):
+        """Store a response until the TTL elapses"""
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO llm_cache (key, response, expires_at) VALUES (?, ?, ?)",
+                    (key, response, time.time() + self.ttl_seconds)
+                )
+                self._prune(conn)
+        except sqlite3.Error as e:
+            logger.warning("LLM cache write failed: %s", e)